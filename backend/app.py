@@ -1,248 +1,318 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///emails.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
-
-# Initialize extensions
-db = SQLAlchemy(app)
-CORS(app)
-
-# Import models and services
-from models.email_model import Email
-from services.classifier_service import EmailClassifier
-from services.gmail_service import GmailService
-from services.llm_service import LLMService
-
-# Initialize services
-classifier = EmailClassifier()
-gmail_service = GmailService()
-llm_service = LLMService()
-
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'model_loaded': classifier.is_model_loaded()
-    })
-
-@app.route('/api/classify', methods=['POST'])
-def classify_email():
-    """Classify an email and generate response"""
-    try:
-        data = request.get_json()
-        email_text = data.get('email_text', '')
-        email_subject = data.get('email_subject', '')
-        
-        if not email_text:
-            return jsonify({'error': 'Email text is required'}), 400
-        
-        # Classify email
-        classification = classifier.classify_email(email_text, email_subject)
-        
-        # Generate auto-response if enabled
-        auto_response = None
-        if classification['confidence'] > 0.7:  # Only auto-respond if confident
-            auto_response = llm_service.generate_response(
-                email_text, 
-                classification['category']
-            )
-        
-        # Store email in database
-        email_record = Email(
-            subject=email_subject,
-            body=email_text,
-            category=classification['category'],
-            confidence=classification['confidence'],
-            auto_response=auto_response
-        )
-        db.session.add(email_record)
-        db.session.commit()
-        
-        return jsonify({
-            'classification': classification,
-            'auto_response': auto_response,
-            'email_id': email_record.id
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/emails', methods=['GET'])
-def get_emails():
-    """Get all classified emails with pagination"""
-    try:
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        category = request.args.get('category', None)
-        
-        query = Email.query
-        
-        if category:
-            query = query.filter(Email.category == category)
-        
-        emails = query.order_by(Email.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        
-        return jsonify({
-            'emails': [email.to_dict() for email in emails.items],
-            'total': emails.total,
-            'pages': emails.pages,
-            'current_page': page
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/emails/<int:email_id>', methods=['PUT'])
-def update_email_category(email_id):
-    """Update email category (for feedback loop)"""
-    try:
-        data = request.get_json()
-        new_category = data.get('category')
-        confidence = data.get('confidence', 1.0)
-        
-        email = Email.query.get_or_404(email_id)
-        email.category = new_category
-        email.confidence = confidence
-        email.updated_at = datetime.now()
-        
-        db.session.commit()
-        
-        # Add to training data for model improvement
-        classifier.add_training_example(email.body, new_category)
-        
-        return jsonify({'message': 'Email updated successfully'})
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/analytics', methods=['GET'])
-def get_analytics():
-    """Get system analytics"""
-    try:
-        # Category distribution
-        category_counts = db.session.query(
-            Email.category, 
-            db.func.count(Email.id)
-        ).group_by(Email.category).all()
-        
-        # Average confidence by category
-        avg_confidence = db.session.query(
-            Email.category,
-            db.func.avg(Email.confidence)
-        ).group_by(Email.category).all()
-        
-        # Recent activity
-        recent_emails = Email.query.order_by(
-            Email.created_at.desc()
-        ).limit(10).all()
-        
-        return jsonify({
-            'category_distribution': dict(category_counts),
-            'average_confidence': dict(avg_confidence),
-            'recent_activity': [email.to_dict() for email in recent_emails]
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/gmail/fetch', methods=['POST'])
-def fetch_gmail_emails():
-    """Fetch new emails from Gmail and classify them"""
-    try:
-        # Fetch unread emails from Gmail
-        emails = gmail_service.fetch_unread_emails()
-        
-        results = []
-        for email in emails:
-            # Classify each email
-            classification = classifier.classify_email(
-                email['body'], 
-                email['subject']
-            )
-            
-            # Generate response if confident
-            auto_response = None
-            if classification['confidence'] > 0.7:
-                auto_response = llm_service.generate_response(
-                    email['body'], 
-                    classification['category']
-                )
-                
-                # Send auto-response if enabled
-                if auto_response:
-                    gmail_service.send_email(
-                        to=email['from'],
-                        subject=f"Re: {email['subject']}",
-                        body=auto_response
-                    )
-            
-            # Store in database
-            email_record = Email(
-                subject=email['subject'],
-                body=email['body'],
-                category=classification['category'],
-                confidence=classification['confidence'],
-                auto_response=auto_response,
-                gmail_id=email['id']
-            )
-            db.session.add(email_record)
-            results.append({
-                'gmail_id': email['id'],
-                'classification': classification,
-                'auto_response_sent': bool(auto_response)
-            })
-        
-        db.session.commit()
-        
-        return jsonify({
-            'emails_processed': len(results),
-            'results': results
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/model/retrain', methods=['POST'])
-def retrain_model():
-    """Retrain the classification model with new data"""
-    try:
-        # Get all labeled emails for training
-        emails = Email.query.filter(Email.confidence == 1.0).all()
-        
-        if len(emails) < 10:
-            return jsonify({'error': 'Need at least 10 labeled emails for training'}), 400
-        
-        # Prepare training data
-        training_data = [(email.body, email.category) for email in emails]
-        
-        # Retrain model
-        accuracy = classifier.retrain_model(training_data)
-        
-        return jsonify({
-            'message': 'Model retrained successfully',
-            'accuracy': accuracy,
-            'training_samples': len(training_data)
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
-    
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime
+import os
+import atexit
+import asyncio
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///emails.db'
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
+
+# Initialize extensions
+db = SQLAlchemy(app)
+CORS(app)
+
+# Import models and services
+from models.email_model import Email
+from services.classifier_service import EmailClassifier
+from services.gmail_service import GmailService
+from services.llm_service import LLMService
+from services.inference_batcher import InferenceBatcher
+
+# Initialize services
+classifier = EmailClassifier()
+gmail_service = GmailService()
+atexit.register(gmail_service.close)
+llm_service = LLMService()
+atexit.register(llm_service.close)
+
+# Concurrent /api/classify requests share batched forward passes
+batcher = InferenceBatcher(classifier)
+CLASSIFY_TIMEOUT = 30  # seconds
+
+# Persist cached predictions across restarts
+atexit.register(classifier.semantic_cache.save)
+
+@app.route('/api/health', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    return jsonify({
+        'status': 'healthy',
+        'timestamp': datetime.utcnow().isoformat(),
+        'model_loaded': classifier.is_model_loaded()
+    })
+
+@app.route('/api/classify', methods=['POST'])
+def classify_email():
+    """Classify an email and generate response"""
+    try:
+        data = request.get_json()
+        email_text = data.get('email_text', '')
+        email_subject = data.get('email_subject', '')
+        
+        if not email_text:
+            return jsonify({'error': 'Email text is required'}), 400
+        
+        # Classify email
+        classification = batcher.submit(email_text, email_subject).result(timeout=CLASSIFY_TIMEOUT)
+        
+        # Generate auto-response if enabled
+        auto_response = None
+        if classification['confidence'] > 0.7:  # Only auto-respond if confident
+            auto_response = llm_service.generate_response(
+                email_text, 
+                classification['category']
+            )
+        
+        # Store email in database
+        email_record = Email(
+            subject=email_subject,
+            body=email_text,
+            category=classification['category'],
+            confidence=classification['confidence'],
+            auto_response=auto_response
+        )
+        db.session.add(email_record)
+        db.session.commit()
+        
+        return jsonify({
+            'classification': classification,
+            'auto_response': auto_response,
+            'email_id': email_record.id
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/emails', methods=['GET'])
+def get_emails():
+    """Get all classified emails with pagination"""
+    try:
+        page = request.args.get('page', 1, type=int)
+        per_page = max(1, min(request.args.get('per_page', 20, type=int), 100))
+        category = request.args.get('category', None)
+        cursor = request.args.get('cursor', None)
+        
+        filters = []
+        if category:
+            filters.append(Email.category == category)
+        
+        if cursor is not None:
+            # Keyset pagination: seek past the last seen (created_at, id) instead of counting rows
+            query = Email.query.filter(*filters)
+            if cursor:
+                try:
+                    cursor_ts, cursor_id = cursor.rsplit('_', 1)
+                    cursor_key = (datetime.fromisoformat(cursor_ts), int(cursor_id))
+                except ValueError:
+                    return jsonify({'error': 'Invalid cursor'}), 400
+                query = query.filter(tuple_(Email.created_at, Email.id) < cursor_key)
+            
+            emails = query.order_by(
+                Email.created_at.desc(), Email.id.desc()
+            ).limit(per_page + 1).all()
+            
+            next_cursor = None
+            if len(emails) > per_page:
+                emails = emails[:per_page]
+                next_cursor = f"{emails[-1].created_at.isoformat()}_{emails[-1].id}"
+            
+            return jsonify({
+                'emails': [email.to_dict() for email in emails],
+                'next_cursor': next_cursor
+            })
+        
+        # Page-number pagination; the total is a plain filtered count rather than
+        # paginate()'s count over the ordered query
+        emails = Email.query.filter(*filters).order_by(
+            Email.created_at.desc(), Email.id.desc()
+        ).paginate(page=page, per_page=per_page, error_out=False, count=False)
+        
+        total = db.session.query(db.func.count(Email.id)).filter(*filters).scalar()
+        
+        return jsonify({
+            'emails': [email.to_dict() for email in emails.items],
+            'total': total,
+            'pages': (total + per_page - 1) // per_page,
+            'current_page': page
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/emails/<int:email_id>', methods=['PUT'])
+def update_email_category(email_id):
+    """Update email category (for feedback loop)"""
+    try:
+        data = request.get_json()
+        new_category = data.get('category')
+        confidence = data.get('confidence', 1.0)
+        
+        email = Email.query.get_or_404(email_id)
+        email.category = new_category
+        email.confidence = confidence
+        
+        db.session.commit()
+        
+        # Add to training data for model improvement
+        classifier.add_training_example(email.body, new_category)
+        
+        return jsonify({'message': 'Email updated successfully'})
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics', methods=['GET'])
+def get_analytics():
+    """Get system analytics"""
+    try:
+        # Category distribution and average confidence in a single grouped scan
+        category_stats = db.session.query(
+            Email.category,
+            db.func.count(Email.id),
+            db.func.avg(Email.confidence)
+        ).group_by(Email.category).all()
+        
+        category_counts = {}
+        avg_confidence = {}
+        for category, count, confidence in category_stats:
+            category_counts[category] = count
+            avg_confidence[category] = confidence
+        
+        # Recent activity
+        recent_emails = Email.query.order_by(
+            Email.created_at.desc()
+        ).limit(10).all()
+        
+        return jsonify({
+            'category_distribution': category_counts,
+            'average_confidence': avg_confidence,
+            'recent_activity': [email.to_dict() for email in recent_emails]
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/gmail/fetch', methods=['POST'])
+def fetch_gmail_emails():
+    """Fetch new emails from Gmail and classify them"""
+    try:
+        # Fetch unread emails from Gmail
+        emails = gmail_service.fetch_unread_emails()
+        
+        # Skip emails that were already stored (single lookup on the unique gmail_id index)
+        known_ids = {
+            gmail_id for (gmail_id,) in db.session.query(Email.gmail_id).filter(
+                Email.gmail_id.in_([email['id'] for email in emails])
+            )
+        }
+        emails = [email for email in emails if email['id'] not in known_ids]
+        
+        # Classify all fetched emails in one batched forward pass
+        classifications = classifier.classify_batch(
+            [email['body'] for email in emails],
+            [email['subject'] for email in emails]
+        )
+        
+        # Generate responses for confident classifications concurrently
+        auto_responses = [None] * len(emails)
+        todo = [i for i, classification in enumerate(classifications) if classification['confidence'] > 0.7]
+        if todo:
+            responses = asyncio.run(llm_service.generate_responses(
+                [(emails[i]['body'], classifications[i]['category']) for i in todo]
+            ))
+            for i, auto_response in zip(todo, responses):
+                auto_responses[i] = auto_response
+        
+        # Collect rows for a single multi-row insert
+        rows = [
+            {
+                'subject': email['subject'],
+                'body': email['body'],
+                'category': classification['category'],
+                'confidence': classification['confidence'],
+                'auto_response': auto_response,
+                'gmail_id': email['id']
+            }
+            for email, classification, auto_response in zip(emails, classifications, auto_responses)
+        ]
+        
+        # INSERT OR IGNORE keeps the batch idempotent if another fetch stored an email meanwhile;
+        # RETURNING yields only the rows this request actually inserted
+        inserted_ids = set()
+        if rows:
+            inserted_ids = set(db.session.execute(
+                sqlite_insert(Email).values(rows)
+                .on_conflict_do_nothing(index_elements=['gmail_id'])
+                .returning(Email.gmail_id)
+            ).scalars())
+        db.session.commit()
+        
+        results = []
+        for email, classification, auto_response in zip(emails, classifications, auto_responses):
+            if email['id'] not in inserted_ids:
+                continue
+            
+            # Send auto-response if enabled (serially: the Gmail client is not thread-safe);
+            # only for stored rows, so overlapping fetches never reply twice
+            if auto_response:
+                gmail_service.send_email(
+                    to=email['from'],
+                    subject=f"Re: {email['subject']}",
+                    body=auto_response
+                )
+            
+            results.append({
+                'gmail_id': email['id'],
+                'classification': classification,
+                'auto_response_sent': bool(auto_response)
+            })
+        
+        return jsonify({
+            'emails_processed': len(results),
+            'emails_skipped': len(known_ids) + len(rows) - len(results),
+            'results': results
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/model/retrain', methods=['POST'])
+def retrain_model():
+    """Retrain the classification model with new data"""
+    try:
+        # Get all labeled emails for training
+        emails = Email.query.filter(Email.confidence == 1.0).all()
+        
+        if len(emails) < 10:
+            return jsonify({'error': 'Need at least 10 labeled emails for training'}), 400
+        
+        # Prepare training data
+        training_data = [(email.body, email.category) for email in emails]
+        
+        # Retrain model
+        accuracy = classifier.retrain_model(training_data)
+        
+        return jsonify({
+            'message': 'Model retrained successfully',
+            'accuracy': accuracy,
+            'training_samples': len(training_data)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+if __name__ == '__main__':
+    with app.app_context():
+        db.create_all()
+    
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
@@ -1,293 +1,698 @@
-import os
-import pickle
-import numpy as np
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, TrainingArguments, Trainer
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, precision_recall_fscore_support
-import torch
-from typing import List, Tuple, Dict
-import logging
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-class EmailClassifier:
-    """Email classification service using BERT"""
-    
-    def __init__(self, model_path: str = None):
-        self.model = None
-        self.tokenizer = None
-        self.categories = ['Support', 'Sales', 'Complaints', 'Feedback', 'General']
-        self.model_path = model_path or 'backend/model/saved_model'
-        self.training_data = []
-        
-        # Load pre-trained model if exists
-        self.load_model()
-        
-        # If no model exists, initialize with default BERT
-        if not self.model:
-            self.initialize_model()
-    
-    def initialize_model(self):
-        """Initialize BERT model for sequence classification"""
-        try:
-            logger.info("Initializing BERT model...")
-            
-            # Use a smaller BERT model for faster inference
-            model_name = "distilbert-base-uncased"
-            
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                model_name,
-                num_labels=len(self.categories),
-                id2label={i: label for i, label in enumerate(self.categories)},
-                label2id={label: i for i, label in enumerate(self.categories)}
-            )
-            
-            logger.info("BERT model initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Error initializing model: {e}")
-            # Fallback to simple rule-based classification
-            self.model = None
-    
-    def load_model(self):
-        """Load saved model from disk"""
-        try:
-            if os.path.exists(os.path.join(self.model_path, 'model.pkl')):
-                with open(os.path.join(self.model_path, 'model.pkl'), 'rb') as f:
-                    saved_data = pickle.load(f)
-                    self.model = saved_data['model']
-                    self.tokenizer = saved_data['tokenizer']
-                    self.training_data = saved_data.get('training_data', [])
-                logger.info("Model loaded successfully")
-                return True
-        except Exception as e:
-            logger.error(f"Error loading model: {e}")
-        return False
-    
-    def save_model(self):
-        """Save model to disk"""
-        try:
-            os.makedirs(self.model_path, exist_ok=True)
-            
-            # Save model and tokenizer
-            model_data = {
-                'model': self.model,
-                'tokenizer': self.tokenizer,
-                'training_data': self.training_data
-            }
-            
-            with open(os.path.join(self.model_path, 'model.pkl'), 'wb') as f:
-                pickle.dump(model_data, f)
-            
-            logger.info("Model saved successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error saving model: {e}")
-            return False
-    
-    def preprocess_text(self, text: str) -> str:
-        """Preprocess email text for classification"""
-        if not text:
-            return ""
-        
-        # Basic text cleaning
-        text = text.lower().strip()
-        
-        # Remove common email artifacts
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        text = ' '.join(text.split())  # Normalize whitespace
-        
-        # Remove email signatures (common patterns)
-        signature_patterns = [
-            'best regards', 'sincerely', 'thanks', 'thank you',
-            'regards', 'cheers', 'yours truly', 'yours sincerely'
-        ]
-        
-        for pattern in signature_patterns:
-            if pattern in text:
-                text = text.split(pattern)[0]
-                break
-        
-        return text[:512]  # BERT has a 512 token limit
-    
-    def classify_email(self, email_text: str, email_subject: str = "") -> Dict:
-        """Classify email and return category with confidence"""
-        try:
-            if not self.model:
-                # Fallback to rule-based classification
-                return self._rule_based_classification(email_text, email_subject)
-            
-            # Combine subject and body for classification
-            combined_text = f"{email_subject} {email_text}"
-            processed_text = self.preprocess_text(combined_text)
-            
-            # Tokenize input
-            inputs = self.tokenizer(
-                processed_text,
-                truncation=True,
-                padding=True,
-                max_length=512,
-                return_tensors="pt"
-            )
-            
-            # Get predictions
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                probabilities = torch.softmax(outputs.logits, dim=-1)
-                predicted_class = torch.argmax(probabilities, dim=-1).item()
-                confidence = probabilities[0][predicted_class].item()
-            
-            category = self.categories[predicted_class]
-            
-            return {
-                'category': category,
-                'confidence': round(confidence, 3),
-                'probabilities': {
-                    cat: round(prob.item(), 3) 
-                    for cat, prob in zip(self.categories, probabilities[0])
-                }
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in classification: {e}")
-            # Fallback to rule-based
-            return self._rule_based_classification(email_text, email_subject)
-    
-    def _rule_based_classification(self, email_text: str, email_subject: str) -> Dict:
-        """Fallback rule-based classification"""
-        combined_text = f"{email_subject} {email_text}".lower()
-        
-        # Define keyword patterns for each category
-        patterns = {
-            'Support': ['help', 'support', 'issue', 'problem', 'error', 'bug', 'broken'],
-            'Sales': ['buy', 'purchase', 'order', 'price', 'cost', 'quote', 'sales'],
-            'Complaints': ['complaint', 'angry', 'unhappy', 'dissatisfied', 'refund', 'return'],
-            'Feedback': ['feedback', 'suggestion', 'improve', 'better', 'experience'],
-            'General': ['question', 'inquiry', 'info', 'information', 'ask']
-        }
-        
-        scores = {}
-        for category, keywords in patterns.items():
-            score = sum(1 for keyword in keywords if keyword in combined_text)
-            scores[category] = score
-        
-        # Get category with highest score
-        if max(scores.values()) == 0:
-            category = 'General'
-            confidence = 0.5
-        else:
-            category = max(scores, key=scores.get)
-            confidence = min(0.8, 0.5 + (scores[category] * 0.1))
-        
-        return {
-            'category': category,
-            'confidence': round(confidence, 3),
-            'method': 'rule_based'
-        }
-    
-    def add_training_example(self, text: str, category: str):
-        """Add training example for model improvement"""
-        if category in self.categories:
-            self.training_data.append((text, category))
-            logger.info(f"Added training example: {category}")
-    
-    def retrain_model(self, training_data: List[Tuple[str, str]] = None) -> float:
-        """Retrain the model with new data"""
-        try:
-            if training_data:
-                self.training_data.extend(training_data)
-            
-            if len(self.training_data) < 10:
-                logger.warning("Not enough training data for retraining")
-                return 0.0
-            
-            logger.info(f"Retraining model with {len(self.training_data)} examples")
-            
-            # Prepare training data
-            texts, labels = zip(*self.training_data)
-            label_ids = [self.categories.index(label) for label in labels]
-            
-            # Split data
-            train_texts, val_texts, train_labels, val_labels = train_test_split(
-                texts, label_ids, test_size=0.2, random_state=42
-            )
-            
-            # Tokenize data
-            train_encodings = self.tokenizer(
-                train_texts, 
-                truncation=True, 
-                padding=True, 
-                return_tensors="pt"
-            )
-            val_encodings = self.tokenizer(
-                val_texts, 
-                truncation=True, 
-                padding=True, 
-                return_tensors="pt"
-            )
-            
-            # Create datasets
-            train_dataset = EmailDataset(train_encodings, train_labels)
-            val_dataset = EmailDataset(val_encodings, val_labels)
-            
-            # Training arguments
-            training_args = TrainingArguments(
-                output_dir='./results',
-                num_train_epochs=3,
-                per_device_train_batch_size=8,
-                per_device_eval_batch_size=8,
-                warmup_steps=500,
-                weight_decay=0.01,
-                logging_dir='./logs',
-                logging_steps=10,
-            )
-            
-            # Initialize trainer
-            trainer = Trainer(
-                model=self.model,
-                args=training_args,
-                train_dataset=train_dataset,
-                eval_dataset=val_dataset,
-            )
-            
-            # Train model
-            trainer.train()
-            
-            # Evaluate
-            predictions = trainer.predict(val_dataset)
-            pred_labels = np.argmax(predictions.predictions, axis=1)
-            accuracy = accuracy_score(val_labels, pred_labels)
-            
-            logger.info(f"Model retrained successfully. Accuracy: {accuracy:.3f}")
-            
-            # Save updated model
-            self.save_model()
-            
-            return accuracy
-            
-        except Exception as e:
-            logger.error(f"Error retraining model: {e}")
-            return 0.0
-    
-    def is_model_loaded(self) -> bool:
-        """Check if model is loaded and ready"""
-        return self.model is not None
-
-
-class EmailDataset(torch.utils.data.Dataset):
-    """Custom dataset for email classification"""
-    
-    def __init__(self, encodings, labels):
-        self.encodings = encodings
-        self.labels = labels
-    
-    def __getitem__(self, idx):
-        item = {key: torch.tensor(val[idx]) for key, val in self.encodings.items()}
-        item['labels'] = torch.tensor(self.labels[idx])
-        return item
-    
-    def __len__(self):
+import os
+import re
+import copy
+import json
+import time
+import shutil
+import threading
+import numpy as np
+from contextlib import contextmanager
+from functools import lru_cache
+from transformers import AutoTokenizer, AutoModelForSequenceClassification, TrainingArguments, Trainer
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+import torch
+from typing import List, Tuple, Dict, Optional
+import logging
+
+from services.semantic_cache import SemanticCache
+
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:  # Optional dependency, inference stays on PyTorch without it
+    onnxruntime = None
+
+try:
+    import fcntl
+except ImportError:  # Windows, the saved model directory is not locked across processes
+    fcntl = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency, keyword matching falls back to substring scans
+    ahocorasick = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Longest text after a sign-off that still counts as a trailing signature (name, title)
+SIGNATURE_TAIL_LENGTH = 60
+
+# Common sign-offs; the first one followed only by a short tail with no further
+# sentence ("best regards, jo") starts the signature, so a body opening with
+# "thanks for ..." is kept
+_SIGNATURE_RE = re.compile(
+    r'\b(?:best regards|sincerely|thank(?:s| you)|regards|cheers|yours (?:truly|sincerely))\b'
+    rf'(?=[,.!:;-]?[^.!?]{{0,{SIGNATURE_TAIL_LENGTH}}}[.!?]?$)'
+)
+
+def _cpu_flags() -> set:
+    """Read the CPU feature flags (Linux only, empty elsewhere)"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return set(line.split(':', 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+def _cpu_supports_bf16() -> bool:
+    """Check for native bfloat16 matmul support (AVX512-BF16 or AMX)"""
+    flags = _cpu_flags()
+    return 'avx512_bf16' in flags or 'amx_bf16' in flags
+
+def _int8_quantization_config():
+    """Pick a dynamic INT8 quantization config for this CPU, or None if unsupported"""
+    flags = _cpu_flags()
+    if 'avx512_vnni' in flags:
+        return AutoQuantizationConfig.avx512_vnni(is_static=False)
+    if 'avx2' in flags:
+        return AutoQuantizationConfig.avx2(is_static=False)
+    return None
+
+class EmailClassifier:
+    """Email classification service using BERT"""
+    
+    # Keyword patterns for the rule-based fallback classifier
+    RULE_PATTERNS = {
+        'Support': ['help', 'support', 'issue', 'problem', 'error', 'bug', 'broken'],
+        'Sales': ['buy', 'purchase', 'order', 'price', 'cost', 'quote', 'sales'],
+        'Complaints': ['complaint', 'angry', 'unhappy', 'dissatisfied', 'refund', 'return'],
+        'Feedback': ['feedback', 'suggestion', 'improve', 'better', 'experience'],
+        'General': ['question', 'inquiry', 'info', 'information', 'ask']
+    }
+    
+    # Seconds between checks for weights saved by another worker process
+    RELOAD_CHECK_INTERVAL = 5.0
+    
+    # Fixed sequence lengths inputs are padded to, so runtimes see few distinct shapes
+    SEQUENCE_BUCKETS = (64, 128, 512)
+    
+    # Longest text kept in the preprocessing/tokenization LRU caches; longer emails
+    # bypass them so cache memory stays bounded by entry count times this length
+    MAX_CACHED_TEXT_LENGTH = 4096
+    
+    def __init__(self, model_path: str = None):
+        self.model = None
+        self.tokenizer = None
+        self.ort_session = None
+        self._ort_pid = None
+        self._loaded_version = None
+        self._next_reload_check = 0.0
+        self._input_buffers = {}
+        self._inference_lock = threading.Lock()
+        self.categories = ['Support', 'Sales', 'Complaints', 'Feedback', 'General']
+        self.model_path = model_path or 'backend/model/saved_model'
+        self.training_data = []
+        self._keyword_automaton = self._build_keyword_automaton()
+        
+        # LRU caches so repeated emails (retries, duplicate fetches) skip
+        # preprocessing and tokenization; cached values are never mutated
+        self._preprocess_cached = lru_cache(maxsize=4096)(self.preprocess_text)
+        self._tokenize_cached = lru_cache(maxsize=4096)(self._tokenize)
+        
+        # Load pre-trained model if exists
+        self.load_model()
+        
+        # If no model exists, initialize with default BERT
+        if not self.model:
+            self.initialize_model()
+        
+        # Cache of recent predictions keyed on sentence embeddings, reloaded from disk
+        # only if it was saved for the same model version
+        self.semantic_cache = SemanticCache(
+            cache_path=os.path.join(self.model_path, 'semantic_cache.npz'),
+            model_version=self._loaded_version
+        )
+        
+        if self.model:
+            self.prepare_for_inference()
+    
+    def initialize_model(self):
+        """Initialize BERT model for sequence classification"""
+        try:
+            logger.info("Initializing BERT model...")
+            
+            # Use a smaller BERT model for faster inference
+            model_name = "distilbert-base-uncased"
+            
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                model_name,
+                num_labels=len(self.categories),
+                id2label={i: label for i, label in enumerate(self.categories)},
+                label2id={label: i for i, label in enumerate(self.categories)}
+            )
+            
+            logger.info("BERT model initialized successfully")
+            
+        except Exception as e:
+            logger.error(f"Error initializing model: {e}")
+            # Fallback to simple rule-based classification
+            self.model = None
+    
+    def prepare_for_inference(self):
+        """Set up the fastest available inference path for the current weights"""
+        self.model, self.ort_session = self._prepare_model(self.model, self._loaded_version)
+        self._ort_pid = os.getpid()
+    
+    def _prepare_model(self, model, version: Optional[str]):
+        """Return the model and ORT session (or None) to serve the given weights with"""
+        model.eval()
+        
+        # Serve predictions from a quantized ONNX Runtime session when possible;
+        # the fp32 weights then move to the meta device so only ORT's copy stays resident
+        ort_session = self.init_onnx_runtime(model, version)
+        if ort_session is not None:
+            return model.to('meta'), ort_session
+        
+        if _cpu_supports_bf16():
+            model = model.to(dtype=torch.bfloat16)
+            logger.info("Using bfloat16 inference")
+        return model, None
+    
+    def init_onnx_runtime(self, model, version: Optional[str]):
+        """Export the model to ONNX with dynamic INT8 quantization and open a CPU session for it"""
+        if onnxruntime is None:
+            logger.info("optimum[onnxruntime] not installed, using PyTorch inference")
+            return None
+        
+        quantization_config = _int8_quantization_config()
+        if quantization_config is None:
+            logger.info("CPU lacks AVX2/AVX512-VNNI, using PyTorch inference")
+            return None
+        
+        # Unsaved base weights have a randomly initialised head that differs per process,
+        # so only weights with a saved version are exported to the shared directory
+        if version is None:
+            logger.info("No saved model version, using PyTorch inference")
+            return None
+        
+        try:
+            onnx_dir = os.path.join(self.model_path, 'onnx')
+            version_path = os.path.join(onnx_dir, 'source_version')
+            
+            with self._model_dir_lock(exclusive=True):
+                # Another worker may already have exported these saved weights
+                exported_version = None
+                if os.path.exists(version_path):
+                    with open(version_path, 'r') as f:
+                        exported_version = f.read().strip()
+                
+                if exported_version != version:
+                    logger.info("Exporting model to quantized ONNX...")
+                    tmp_dir = os.path.join(onnx_dir, f"export.{os.getpid()}.tmp")
+                    export_dir = os.path.join(tmp_dir, 'model')
+                    
+                    try:
+                        # Export from the in-memory weights so the ONNX graph matches the served model
+                        model.save_pretrained(export_dir)
+                        self.tokenizer.save_pretrained(export_dir)
+                        ort_model = ORTModelForSequenceClassification.from_pretrained(export_dir, export=True)
+                        
+                        quantizer = ORTQuantizer.from_pretrained(ort_model)
+                        quantizer.quantize(save_dir=tmp_dir, quantization_config=quantization_config)
+                        
+                        # Rename into place, so a reader never opens a half-written graph
+                        os.replace(
+                            os.path.join(tmp_dir, 'model_quantized.onnx'),
+                            os.path.join(onnx_dir, 'model_quantized.onnx')
+                        )
+                        with open(f"{version_path}.tmp", 'w') as f:
+                            f.write(version)
+                        os.replace(f"{version_path}.tmp", version_path)
+                    finally:
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+                
+                ort_session = self._open_ort_session()
+            
+            logger.info("ONNX Runtime session initialized successfully")
+            return ort_session
+            
+        except Exception as e:
+            logger.error(f"Error initializing ONNX Runtime, using PyTorch inference: {e}")
+            return None
+    
+    def _open_ort_session(self):
+        """Open the quantized model in this process (ORT sessions are not fork-safe); hold the model directory lock"""
+        return onnxruntime.InferenceSession(
+            os.path.join(self.model_path, 'onnx', 'model_quantized.onnx'),
+            providers=['CPUExecutionProvider']
+        )
+    
+    @contextmanager
+    def _model_dir_lock(self, exclusive: bool = False):
+        """Cross-process lock on the saved model directory (no-op without fcntl)"""
+        os.makedirs(os.path.dirname(self.model_path) or '.', exist_ok=True)
+        with open(f"{self.model_path}.lock", 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _read_model_version(self) -> Optional[str]:
+        """Read the version marker written by the last save_model, if any"""
+        try:
+            with open(os.path.join(self.model_path, 'model_version'), 'r') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+    
+    def _maybe_reload(self):
+        """Pick up weights another worker process saved (e.g. after retraining)"""
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + self.RELOAD_CHECK_INTERVAL
+        
+        if self._read_model_version() in (None, self._loaded_version):
+            return
+        
+        with self._inference_lock:
+            if self._read_model_version() == self._loaded_version:
+                return
+            
+            logger.info("Saved model changed on disk, reloading")
+            if self.load_model():
+                self._clear_text_caches()
+                self.semantic_cache.clear(self._loaded_version)
+                self.prepare_for_inference()
+    
+    def _clear_text_caches(self):
+        """Drop cached preprocessing and tokenization results after a model swap"""
+        self._preprocess_cached.cache_clear()
+        self._tokenize_cached.cache_clear()
+    
+    def load_model(self):
+        """Load saved model from disk"""
+        try:
+            if os.path.exists(os.path.join(self.model_path, 'config.json')):
+                with self._model_dir_lock():
+                    # Weights are memory-mapped from model.safetensors
+                    self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+                    self.model = AutoModelForSequenceClassification.from_pretrained(self.model_path)
+                    
+                    training_data_path = os.path.join(self.model_path, 'training_data.json')
+                    if os.path.exists(training_data_path):
+                        with open(training_data_path, 'r', encoding='utf-8') as f:
+                            self.training_data = [tuple(example) for example in json.load(f)]
+                    
+                    self._loaded_version = self._read_model_version()
+                
+                logger.info("Model loaded successfully")
+                return True
+        except Exception as e:
+            logger.error(f"Error loading model: {e}")
+        return False
+    
+    def save_model(self, model=None):
+        """Save model (the served one by default) to disk"""
+        try:
+            os.makedirs(self.model_path, exist_ok=True)
+            
+            with self._model_dir_lock(exclusive=True):
+                # Save model weights as safetensors, plus tokenizer and training data
+                (model if model is not None else self.model).save_pretrained(self.model_path, safe_serialization=True)
+                self.tokenizer.save_pretrained(self.model_path)
+                
+                with open(os.path.join(self.model_path, 'training_data.json'), 'w', encoding='utf-8') as f:
+                    json.dump(self.training_data, f, ensure_ascii=False)
+                
+                # Bump the version marker last (atomic rename) so other workers reload
+                version = str(time.time_ns())
+                version_path = os.path.join(self.model_path, 'model_version')
+                with open(f"{version_path}.tmp", 'w') as f:
+                    f.write(version)
+                os.replace(f"{version_path}.tmp", version_path)
+                self._loaded_version = version
+            
+            logger.info("Model saved successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error saving model: {e}")
+            return False
+    
+    def preprocess_text(self, text: str) -> str:
+        """Preprocess email text for classification"""
+        if not text:
+            return ""
+        
+        # Basic text cleaning and whitespace normalization (newlines included)
+        text = _WHITESPACE_RE.sub(' ', text.lower()).strip()
+        
+        # Remove email signatures (common patterns)
+        match = _SIGNATURE_RE.search(text)
+        if match:
+            text = text[:match.start()]
+        
+        return text
+    
+    def _preprocess(self, text: str) -> str:
+        """Preprocess through the LRU cache unless the text is too long to cache"""
+        if len(text) > self.MAX_CACHED_TEXT_LENGTH:
+            return self.preprocess_text(text)
+        return self._preprocess_cached(text)
+    
+    def classify_email(self, email_text: str, email_subject: str = "") -> Dict:
+        """Classify email and return category with confidence"""
+        return self.classify_batch([email_text], [email_subject])[0]
+    
+    def classify_batch(self, email_texts: List[str], email_subjects: List[str] = None) -> List[Dict]:
+        """Classify several emails with a single batched forward pass"""
+        if email_subjects is None:
+            email_subjects = [""] * len(email_texts)
+        
+        try:
+            if not self.model:
+                # Fallback to rule-based classification
+                return [
+                    self._rule_based_classification(text, subject)
+                    for text, subject in zip(email_texts, email_subjects)
+                ]
+            
+            self._maybe_reload()
+            
+            # Combine subject and body for classification
+            processed_texts = [
+                self._preprocess(f"{subject} {text}")
+                for text, subject in zip(email_texts, email_subjects)
+            ]
+            
+            # Short, keyword-dominated emails are answered by the rule-based classifier
+            results = [self._rule_based_shortcut(text) for text in processed_texts]
+            embeddings = {}
+            
+            # Skip the BERT forward pass for near-duplicates of recent emails
+            remaining = [i for i, result in enumerate(results) if result is None]
+            if remaining and self.semantic_cache.is_enabled():
+                batch_embeddings = self.semantic_cache.embed([processed_texts[i] for i in remaining])
+                for i, embedding in zip(remaining, batch_embeddings):
+                    embeddings[i] = embedding
+                    results[i] = self.semantic_cache.lookup(embedding)
+            
+            pending = [i for i, result in enumerate(results) if result is None]
+            if not pending:
+                return results
+            
+            # Tokenize all uncached emails into one fixed-shape padded batch
+            # and get predictions; the shared input buffers are guarded by a lock
+            with self._inference_lock, torch.inference_mode():
+                inputs = self._encode_batch([processed_texts[i] for i in pending])
+                logits = self._predict_logits(inputs)
+                served_model = self.model
+            
+            # Softmax over the few classes in NumPy (float64 so rounded values stay clean),
+            # then one conversion to Python floats
+            logits = logits.astype(np.float64)
+            exp_logits = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probabilities = exp_logits / exp_logits.sum(axis=-1, keepdims=True)
+            predicted_classes = probabilities.argmax(axis=-1).tolist()
+            rounded_probabilities = np.round(probabilities, 3).tolist()
+            
+            for i, predicted_class, probs in zip(pending, predicted_classes, rounded_probabilities):
+                results[i] = {
+                    'category': self.categories[predicted_class],
+                    'confidence': probs[predicted_class],
+                    'probabilities': dict(zip(self.categories, probs))
+                }
+            
+            # Cache only predictions of weights still being served, not ones swapped out meanwhile
+            with self._inference_lock:
+                if self.model is served_model:
+                    for i in pending:
+                        if i in embeddings:
+                            self.semantic_cache.add(embeddings[i], results[i])
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in classification: {e}")
+            # Fallback to rule-based
+            return [
+                self._rule_based_classification(text, subject)
+                for text, subject in zip(email_texts, email_subjects)
+            ]
+    
+    def _tokenize(self, text: str) -> torch.Tensor:
+        """Tokenize a single preprocessed text into a 1-D tensor of input ids"""
+        input_ids = self.tokenizer(
+            text,
+            truncation=True,
+            max_length=512,
+            return_tensors=None
+        )['input_ids']
+        return torch.tensor(input_ids, dtype=torch.long)
+    
+    def _encode_batch(self, texts: List[str]) -> Dict[str, torch.Tensor]:
+        """Tokenize texts and pad them to the smallest fitting sequence bucket"""
+        encodings = [
+            self._tokenize_cached(text) if len(text) <= self.MAX_CACHED_TEXT_LENGTH else self._tokenize(text)
+            for text in texts
+        ]
+        
+        longest = max(len(ids) for ids in encodings)
+        bucket = next(size for size in self.SEQUENCE_BUCKETS if longest <= size)
+        
+        # Reuse one preallocated buffer pair per bucket, grown only when a larger batch arrives
+        buffers = self._input_buffers.get(bucket)
+        if buffers is None or buffers[0].shape[0] < len(texts):
+            buffers = (
+                torch.zeros((len(texts), bucket), dtype=torch.long),
+                torch.zeros((len(texts), bucket), dtype=torch.long)
+            )
+            self._input_buffers[bucket] = buffers
+        
+        input_ids = buffers[0][:len(texts)]
+        attention_mask = buffers[1][:len(texts)]
+        input_ids.fill_(self.tokenizer.pad_token_id)
+        attention_mask.zero_()
+        
+        for row, ids in enumerate(encodings):
+            input_ids[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+        
+        return {'input_ids': input_ids, 'attention_mask': attention_mask}
+    
+    def _predict_logits(self, inputs) -> np.ndarray:
+        """Run the forward pass on ONNX Runtime if available, PyTorch otherwise"""
+        if self.ort_session is not None:
+            if self._ort_pid != os.getpid():
+                with self._model_dir_lock():
+                    self.ort_session = self._open_ort_session()
+                self._ort_pid = os.getpid()
+            
+            logits = self.ort_session.run(None, {
+                'input_ids': inputs['input_ids'].numpy(),
+                'attention_mask': inputs['attention_mask'].numpy()
+            })[0]
+            return logits.astype(np.float32, copy=False)
+        
+        return self.model(**inputs).logits.float().cpu().numpy()
+    
+    def _build_keyword_automaton(self):
+        """Compile all rule-based keywords into a single Aho-Corasick automaton"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for category_idx, keywords in enumerate(self.RULE_PATTERNS.values()):
+            for keyword in keywords:
+                automaton.add_word(keyword, (category_idx, keyword))
+        automaton.make_automaton()
+        return automaton
+    
+    def _keyword_scores(self, text: str) -> List[int]:
+        """Count distinct keywords found in the text, per category in RULE_PATTERNS order"""
+        scores = [0] * len(self.RULE_PATTERNS)
+        
+        if self._keyword_automaton is not None:
+            # One linear pass over the text; repeated occurrences count once
+            seen = set()
+            for _, match in self._keyword_automaton.iter(text):
+                if match not in seen:
+                    seen.add(match)
+                    scores[match[0]] += 1
+        else:
+            for category_idx, keywords in enumerate(self.RULE_PATTERNS.values()):
+                scores[category_idx] = sum(1 for keyword in keywords if keyword in text)
+        
+        return scores
+    
+    def _rule_based_shortcut(self, processed_text: str) -> Optional[Dict]:
+        """Return a rule-based result when a short email clearly matches one category"""
+        if processed_text.count(' ') + 1 >= 10:
+            return None
+        
+        scores = self._keyword_scores(processed_text)
+        best_score, second_score = sorted(scores, reverse=True)[:2]
+        if best_score < 3 or best_score < 2 * second_score:
+            return None
+        
+        return {
+            'category': list(self.RULE_PATTERNS)[scores.index(best_score)],
+            'confidence': round(min(0.85, 0.5 + 0.1 * best_score), 3),
+            'method': 'rule_based_shortcut'
+        }
+    
+    def _rule_based_classification(self, email_text: str, email_subject: str) -> Dict:
+        """Fallback rule-based classification"""
+        combined_text = f"{email_subject} {email_text}".lower()
+        
+        scores = dict(zip(self.RULE_PATTERNS, self._keyword_scores(combined_text)))
+        
+        # Get category with highest score
+        if max(scores.values()) == 0:
+            category = 'General'
+            confidence = 0.5
+        else:
+            category = max(scores, key=scores.get)
+            confidence = min(0.8, 0.5 + (scores[category] * 0.1))
+        
+        return {
+            'category': category,
+            'confidence': round(confidence, 3),
+            'method': 'rule_based'
+        }
+    
+    def add_training_example(self, text: str, category: str):
+        """Add training example for model improvement"""
+        if category in self.categories:
+            self.training_data.append((text, category))
+            logger.info(f"Added training example: {category}")
+    
+    def retrain_model(self, training_data: List[Tuple[str, str]] = None) -> float:
+        """Retrain the model with new data"""
+        try:
+            if training_data:
+                self.training_data.extend(training_data)
+            
+            if len(self.training_data) < 10:
+                logger.warning("Not enough training data for retraining")
+                return 0.0
+            
+            logger.info(f"Retraining model with {len(self.training_data)} examples")
+            
+            # Prepare training data (label ids straight into one array, no intermediate lists)
+            cat_to_id = {category: i for i, category in enumerate(self.categories)}
+            label_ids = np.fromiter(
+                (cat_to_id[label] for _, label in self.training_data),
+                dtype=np.int64,
+                count=len(self.training_data)
+            )
+            
+            # Split row indices, then gather texts per split from training_data
+            train_idx, val_idx = train_test_split(
+                np.arange(len(self.training_data)), test_size=0.2, random_state=42
+            )
+            train_texts = [self.training_data[i][0] for i in train_idx]
+            val_texts = [self.training_data[i][0] for i in val_idx]
+            train_labels = label_ids[train_idx]
+            val_labels = label_ids[val_idx]
+            
+            # Tokenize data
+            train_encodings = self.tokenizer(
+                train_texts, 
+                truncation=True, 
+                padding=True, 
+                return_tensors="pt"
+            )
+            val_encodings = self.tokenizer(
+                val_texts, 
+                truncation=True, 
+                padding=True, 
+                return_tensors="pt"
+            )
+            
+            # Create datasets
+            train_dataset = EmailDataset(train_encodings, train_labels)
+            val_dataset = EmailDataset(val_encodings, val_labels)
+            
+            # Training arguments
+            training_args = TrainingArguments(
+                output_dir='./results',
+                num_train_epochs=3,
+                per_device_train_batch_size=8,
+                per_device_eval_batch_size=8,
+                warmup_steps=500,
+                weight_decay=0.01,
+                logging_dir='./logs',
+                logging_steps=10,
+            )
+            
+            # Train a copy so the served model keeps answering requests meanwhile;
+            # its weights are on the meta device while ORT serves predictions
+            model = self.model
+            if model.device.type == 'meta':
+                with self._model_dir_lock():
+                    model = AutoModelForSequenceClassification.from_pretrained(self.model_path)
+            else:
+                model = copy.deepcopy(model)
+            
+            # Train in full precision even if inference was running in bfloat16
+            model = model.float()
+            
+            # Initialize trainer
+            trainer = Trainer(
+                model=model,
+                args=training_args,
+                train_dataset=train_dataset,
+                eval_dataset=val_dataset,
+            )
+            
+            # Train model
+            trainer.train()
+            
+            # Evaluate
+            predictions = trainer.predict(val_dataset)
+            pred_labels = np.argmax(predictions.predictions, axis=1)
+            accuracy = accuracy_score(val_labels, pred_labels)
+            
+            logger.info(f"Model retrained successfully. Accuracy: {accuracy:.3f}")
+            
+            # Save updated model
+            version = self._loaded_version if self.save_model(model) else None
+            
+            # Export and open the new inference path, then swap it in together with the cache
+            # reset so no request sees half of it; cached predictions came from the previous
+            # weights, and new ones are not persisted at all if saving failed
+            model, ort_session = self._prepare_model(model, version)
+            with self._inference_lock:
+                self.model, self.ort_session, self._ort_pid = model, ort_session, os.getpid()
+                self._clear_text_caches()
+                self.semantic_cache.clear(version)
+            
+            return accuracy
+            
+        except Exception as e:
+            logger.error(f"Error retraining model: {e}")
+            return 0.0
+    
+    def is_model_loaded(self) -> bool:
+        """Check if model is loaded and ready"""
+        return self.model is not None
+
+
+class EmailDataset(torch.utils.data.Dataset):
+    """Custom dataset for email classification"""
+    
+    def __init__(self, encodings, labels):
+        # Convert once up front; __getitem__ then only returns row views
+        self.encodings = {key: torch.as_tensor(val) for key, val in encodings.items()}
+        self.labels = torch.as_tensor(labels, dtype=torch.long)
+    
+    def __getitem__(self, idx):
+        item = {key: val[idx] for key, val in self.encodings.items()}
+        item['labels'] = self.labels[idx]
+        return item
+    
+    def __len__(self):
         return len(self.labels) 
\ No newline at end of file
@@ -1,282 +1,571 @@
-import os
-import base64
-import email
-from typing import List, Dict, Optional
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import logging
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-class GmailService:
-    """Gmail API service for email operations"""
-    
-    # Gmail API scopes
-    SCOPES = [
-        'https://www.googleapis.com/auth/gmail.readonly',
-        'https://www.googleapis.com/auth/gmail.send',
-        'https://www.googleapis.com/auth/gmail.modify'
-    ]
-    
-    def __init__(self):
-        self.service = None
-        self.credentials = None
-        self.authenticate()
-    
-    def authenticate(self):
-        """Authenticate with Gmail API using OAuth2"""
-        try:
-            creds = None
-            
-            # Check if token file exists
-            token_path = 'backend/credentials/token.json'
-            if os.path.exists(token_path):
-                creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
-            
-            # If no valid credentials, let user log in
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    # Check if credentials file exists
-                    creds_file = 'backend/credentials/credentials.json'
-                    if not os.path.exists(creds_file):
-                        logger.error("credentials.json not found. Please download from Google Cloud Console")
-                        return
-                    
-                    flow = InstalledAppFlow.from_client_secrets_file(creds_file, self.SCOPES)
-                    creds = flow.run_local_server(port=0)
-                
-                # Save credentials for next run
-                os.makedirs('backend/credentials', exist_ok=True)
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-            
-            self.credentials = creds
-            self.service = build('gmail', 'v1', credentials=creds)
-            logger.info("Gmail authentication successful")
-            
-        except Exception as e:
-            logger.error(f"Gmail authentication failed: {e}")
-            self.service = None
-    
-    def fetch_unread_emails(self, max_results: int = 10) -> List[Dict]:
-        """Fetch unread emails from Gmail"""
-        try:
-            if not self.service:
-                logger.error("Gmail service not authenticated")
-                return []
-            
-            # Query for unread emails
-            results = self.service.users().messages().list(
-                userId='me',
-                labelIds=['UNREAD'],
-                maxResults=max_results
-            ).execute()
-            
-            messages = results.get('messages', [])
-            emails = []
-            
-            for message in messages:
-                try:
-                    email_data = self._get_email_details(message['id'])
-                    if email_data:
-                        emails.append(email_data)
-                except Exception as e:
-                    logger.error(f"Error processing email {message['id']}: {e}")
-                    continue
-            
-            logger.info(f"Fetched {len(emails)} unread emails")
-            return emails
-            
-        except HttpError as error:
-            logger.error(f"Gmail API error: {error}")
-            return []
-        except Exception as e:
-            logger.error(f"Error fetching emails: {e}")
-            return []
-    
-    def _get_email_details(self, message_id: str) -> Optional[Dict]:
-        """Get detailed information about a specific email"""
-        try:
-            message = self.service.users().messages().get(
-                userId='me',
-                id=message_id,
-                format='full'
-            ).execute()
-            
-            headers = message['payload']['headers']
-            
-            # Extract email details
-            subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-            from_email = next((h['value'] for h in headers if h['name'] == 'From'), 'Unknown')
-            to_email = next((h['value'] for h in headers if h['name'] == 'To'), 'Unknown')
-            date = next((h['value'] for h in headers if h['name'] == 'Date'), '')
-            
-            # Extract email body
-            body = self._extract_email_body(message['payload'])
-            
-            return {
-                'id': message_id,
-                'subject': subject,
-                'from': from_email,
-                'to': to_email,
-                'date': date,
-                'body': body,
-                'snippet': message.get('snippet', '')
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting email details: {e}")
-            return None
-    
-    def _extract_email_body(self, payload: Dict) -> str:
-        """Extract email body from Gmail API payload"""
-        try:
-            if 'body' in payload and payload['body'].get('data'):
-                # Simple text email
-                data = payload['body']['data']
-                return base64.urlsafe_b64decode(data).decode('utf-8')
-            
-            elif 'parts' in payload:
-                # Multipart email
-                for part in payload['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        if 'data' in part['body']:
-                            data = part['body']['data']
-                            return base64.urlsafe_b64decode(data).decode('utf-8')
-                    elif part['mimeType'] == 'text/html':
-                        if 'data' in part['body']:
-                            data = part['body']['data']
-                            html_content = base64.urlsafe_b64decode(data).decode('utf-8')
-                            # Simple HTML to text conversion
-                            import re
-                            text_content = re.sub('<[^<]+?>', '', html_content)
-                            return text_content
-            
-            return "No readable content found"
-            
-        except Exception as e:
-            logger.error(f"Error extracting email body: {e}")
-            return "Error reading email content"
-    
-    def send_email(self, to: str, subject: str, body: str, reply_to: str = None) -> bool:
-        """Send an email via Gmail API"""
-        try:
-            if not self.service:
-                logger.error("Gmail service not authenticated")
-                return False
-            
-            # Create email message
-            message = self._create_message(to, subject, body, reply_to)
-            
-            # Send email
-            sent_message = self.service.users().messages().send(
-                userId='me',
-                body=message
-            ).execute()
-            
-            logger.info(f"Email sent successfully: {sent_message['id']}")
-            return True
-            
-        except HttpError as error:
-            logger.error(f"Gmail API error sending email: {error}")
-            return False
-        except Exception as e:
-            logger.error(f"Error sending email: {e}")
-            return False
-    
-    def _create_message(self, to: str, subject: str, body: str, reply_to: str = None) -> Dict:
-        """Create Gmail API message format"""
-        message = email.mime.text.MIMEText(body)
-        message['to'] = to
-        message['subject'] = subject
-        
-        if reply_to:
-            message['reply-to'] = reply_to
-        
-        # Encode message
-        raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
-        
-        return {'raw': raw_message}
-    
-    def mark_as_read(self, message_id: str) -> bool:
-        """Mark an email as read"""
-        try:
-            if not self.service:
-                return False
-            
-            # Remove UNREAD label
-            self.service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body={'removeLabelIds': ['UNREAD']}
-            ).execute()
-            
-            logger.info(f"Marked email {message_id} as read")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error marking email as read: {e}")
-            return False
-    
-    def add_label(self, message_id: str, label_name: str) -> bool:
-        """Add a label to an email"""
-        try:
-            if not self.service:
-                return False
-            
-            # Get or create label
-            label_id = self._get_or_create_label(label_name)
-            
-            # Add label to message
-            self.service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body={'addLabelIds': [label_id]}
-            ).execute()
-            
-            logger.info(f"Added label '{label_name}' to email {message_id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error adding label: {e}")
-            return False
-    
-    def _get_or_create_label(self, label_name: str) -> str:
-        """Get existing label or create new one"""
-        try:
-            # List existing labels
-            results = self.service.users().labels().list(userId='me').execute()
-            labels = results.get('labels', [])
-            
-            # Check if label exists
-            for label in labels:
-                if label['name'] == label_name:
-                    return label['id']
-            
-            # Create new label
-            label_object = {
-                'name': label_name,
-                'labelListVisibility': 'labelShow',
-                'messageListVisibility': 'show'
-            }
-            
-            created_label = self.service.users().labels().create(
-                userId='me',
-                body=label_object
-            ).execute()
-            
-            return created_label['id']
-            
-        except Exception as e:
-            logger.error(f"Error managing labels: {e}")
-            return 'INBOX'  # Fallback to inbox
-    
-    def is_authenticated(self) -> bool:
-        """Check if Gmail service is authenticated"""
-        return self.service is not None 
\ No newline at end of file
+import os
+import base64
+import binascii
+import codecs
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
+from html.parser import HTMLParser
+from typing import Iterator, List, Dict, Optional
+import httplib2
+import google_auth_httplib2
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+import logging
+
+try:
+    import pybase64
+except ImportError:  # Optional dependency, SIMD base64 falls back to the stdlib codec
+    pybase64 = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:  # Optional dependency, HTML is stripped with the stdlib parser instead
+    SelectolaxParser = None
+
+try:
+    import diskcache
+except ImportError:  # Optional dependency, messages are always fetched from Gmail
+    diskcache = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_b64 = pybase64 if pybase64 is not None else base64
+
+class _HTMLTextExtractor(HTMLParser):
+    """Incremental HTML-to-text stripper: fed decoded chunks, keeps only visible text"""
+    
+    SKIPPED_TAGS = frozenset({'script', 'style'})
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._parts = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag: str, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+    
+    def handle_endtag(self, tag: str):
+        if tag in self.SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+    
+    def handle_data(self, data: str):
+        if not self._skip_depth:
+            self._parts.append(data)
+    
+    def text(self) -> str:
+        return ''.join(self._parts)
+
+class GmailService:
+    """Gmail API service for email operations"""
+    
+    # Gmail API scopes
+    SCOPES = [
+        'https://www.googleapis.com/auth/gmail.readonly',
+        'https://www.googleapis.com/auth/gmail.send',
+        'https://www.googleapis.com/auth/gmail.modify'
+    ]
+    
+    # Credentials shared by every instance in this process; token.json is read once
+    _credentials_cache = None
+    
+    # Gmail system labels, whose id is their name; no labels.list lookup needed
+    SYSTEM_LABELS = frozenset({
+        'INBOX', 'UNREAD', 'STARRED', 'IMPORTANT', 'SENT', 'DRAFT', 'SPAM', 'TRASH',
+        'CATEGORY_PERSONAL', 'CATEGORY_SOCIAL', 'CATEGORY_PROMOTIONS',
+        'CATEGORY_UPDATES', 'CATEGORY_FORUMS'
+    })
+    
+    # Maximum sub-requests per Gmail batch HTTP request
+    BATCH_SIZE = 100
+    
+    # Concurrent per-message fetches when the batch endpoint cannot be used
+    FETCH_WORKERS = 10
+    
+    # Bodies are decoded in slices of this many base64 characters (a multiple of 4)
+    DECODE_CHUNK_SIZE = 64 * 1024
+    
+    # Cap on decoded body bytes kept per fetched email
+    MAX_BODY_BYTES = 1024 * 1024
+    
+    # Headers requested for metadata-only (list view) fetches
+    METADATA_HEADERS = ['Subject', 'From', 'To', 'Date']
+    
+    # On-disk LRU of parsed full messages; a message's content never changes for its id
+    MESSAGE_CACHE_DIR = 'backend/credentials/.msgcache'
+    MESSAGE_CACHE_SIZE = 256 * 1024 * 1024  # bytes
+    
+    def __init__(self):
+        self.service = None
+        self.credentials = None
+        self._pool = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS, thread_name_prefix='gmail-fetch')
+        self._thread_local = threading.local()
+        
+        # Label name -> id, loaded on first use; labels rarely change
+        self._label_cache = None
+        self._label_lock = threading.Lock()
+        
+        self._message_cache = self._open_message_cache()
+        
+        self.authenticate()
+    
+    def authenticate(self):
+        """Authenticate with Gmail API using OAuth2"""
+        try:
+            creds = GmailService._credentials_cache
+            
+            # Check if token file exists (first authentication in this process only)
+            token_path = 'backend/credentials/token.json'
+            if creds is None and os.path.exists(token_path):
+                creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
+            
+            # If no valid credentials, let user log in
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    creds.refresh(Request())
+                else:
+                    # Check if credentials file exists
+                    creds_file = 'backend/credentials/credentials.json'
+                    if not os.path.exists(creds_file):
+                        logger.error("credentials.json not found. Please download from Google Cloud Console")
+                        return
+                    
+                    flow = InstalledAppFlow.from_client_secrets_file(creds_file, self.SCOPES)
+                    creds = flow.run_local_server(port=0)
+                
+                # Save credentials for next run
+                os.makedirs('backend/credentials', exist_ok=True)
+                self._save_token(creds, token_path)
+            
+            GmailService._credentials_cache = creds
+            self.credentials = creds
+            self._label_cache = None
+            self.service = self._build_service(credentials=creds)
+            logger.info("Gmail authentication successful")
+            
+        except Exception as e:
+            logger.error(f"Gmail authentication failed: {e}")
+            self.service = None
+    
+    @staticmethod
+    def _save_token(creds: Credentials, token_path: str):
+        """Write token.json via fsync and rename, so a crash never leaves a truncated file"""
+        tmp_path = f"{token_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as token:
+            token.write(creds.to_json())
+            token.flush()
+            os.fsync(token.fileno())
+        os.replace(tmp_path, token_path)
+    
+    @staticmethod
+    def _build_service(**kwargs):
+        """Build a Gmail client from the discovery document bundled with googleapiclient"""
+        # No discovery HTTP fetch, and no probe of the oauth2client-only file cache
+        return build('gmail', 'v1', static_discovery=True, cache_discovery=False, **kwargs)
+    
+    def _open_message_cache(self):
+        """Open the on-disk message cache, or None if diskcache is unavailable"""
+        if diskcache is None:
+            return None
+        
+        try:
+            return diskcache.Cache(
+                self.MESSAGE_CACHE_DIR,
+                size_limit=self.MESSAGE_CACHE_SIZE,
+                eviction_policy='least-recently-used'
+            )
+        except Exception as e:
+            logger.error(f"Error opening message cache: {e}")
+            return None
+    
+    def _get_cached_message(self, message_id: str) -> Optional[Dict]:
+        """Look up a previously fetched full message"""
+        if self._message_cache is None:
+            return None
+        try:
+            return self._message_cache.get(message_id)
+        except Exception as e:
+            logger.error(f"Error reading message cache: {e}")
+            return None
+    
+    def _cache_message(self, email_data: Dict):
+        """Store a fetched full message"""
+        if self._message_cache is None:
+            return
+        try:
+            self._message_cache.set(email_data['id'], email_data)
+        except Exception as e:
+            logger.error(f"Error writing message cache: {e}")
+    
+    def fetch_unread_emails(self, max_results: int = 10, include_body: bool = True) -> List[Dict]:
+        """Fetch unread emails from Gmail (headers only, body None, unless include_body)"""
+        try:
+            if not self.service:
+                logger.error("Gmail service not authenticated")
+                return []
+            
+            # Query for unread emails
+            results = self.service.users().messages().list(
+                userId='me',
+                labelIds=['UNREAD'],
+                maxResults=max_results
+            ).execute()
+            
+            message_ids = [message['id'] for message in results.get('messages', [])]
+            emails = self._fetch_messages_batched(message_ids, full=include_body)
+            
+            logger.info(f"Fetched {len(emails)} unread emails")
+            return emails
+            
+        except HttpError as error:
+            logger.error(f"Gmail API error: {error}")
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching emails: {e}")
+            return []
+    
+    def _fetch_messages_batched(self, message_ids: List[str], full: bool = True) -> List[Dict]:
+        """Fetch messages via the Gmail batch endpoint, BATCH_SIZE per HTTP round-trip"""
+        fetched = {}
+        
+        # Full messages seen before are served from the disk cache
+        if full:
+            for message_id in message_ids:
+                email_data = self._get_cached_message(message_id)
+                if email_data is not None:
+                    fetched[message_id] = email_data
+        pending = [message_id for message_id in message_ids if message_id not in fetched]
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error fetching email {request_id} in batch: {exception}")
+                return
+            try:
+                fetched[request_id] = self._parse_message(response, full)
+            except Exception as e:
+                logger.error(f"Error processing email {request_id}: {e}")
+        
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for message_id in pending[start:start + self.BATCH_SIZE]:
+                batch.add(self._message_request(self.service, message_id, full), request_id=message_id)
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.error(f"Gmail batch request failed: {e}")
+        
+        # Fetch anything the batch could not deliver (e.g. per-request rate limits) individually
+        missing = [message_id for message_id in pending if message_id not in fetched]
+        if missing:
+            fetched.update(self._fetch_messages_parallel(missing, full))
+        
+        if full:
+            for message_id in pending:
+                if message_id in fetched:
+                    self._cache_message(fetched[message_id])
+        
+        return [fetched[message_id] for message_id in message_ids if message_id in fetched]
+    
+    def _fetch_messages_parallel(self, message_ids: List[str], full: bool = True) -> Dict[str, Dict]:
+        """Fetch messages one request each, overlapping round-trips on the worker pool"""
+        results = self._pool.map(
+            lambda message_id: self._get_email_details(message_id, self._thread_service(), full),
+            message_ids
+        )
+        return {
+            message_id: email_data
+            for message_id, email_data in zip(message_ids, results)
+            if email_data
+        }
+    
+    def _thread_service(self):
+        """Gmail client for the current thread; discovery clients and httplib2 are not thread-safe"""
+        local = self._thread_local
+        if getattr(local, 'credentials', None) is not self.credentials:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            local.service = self._build_service(http=http)
+            local.credentials = self.credentials
+        return local.service
+    
+    def _message_request(self, service, message_id: str, full: bool):
+        """messages.get request for the whole message, or only the headers a listing needs"""
+        if full:
+            return service.users().messages().get(userId='me', id=message_id, format='full')
+        return service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='metadata',
+            metadataHeaders=self.METADATA_HEADERS
+        )
+    
+    def _get_email_details(self, message_id: str, service=None, full: bool = False) -> Optional[Dict]:
+        """Get detailed information about a specific email (body only when full)"""
+        try:
+            message = self._message_request(service or self.service, message_id, full).execute()
+            
+            return self._parse_message(message, full)
+            
+        except Exception as e:
+            logger.error(f"Error getting email details: {e}")
+            return None
+    
+    def fetch_body(self, message_id: str) -> Optional[str]:
+        """Fetch and decode the body of one email, e.g. after a metadata-only listing"""
+        try:
+            if not self.service:
+                logger.error("Gmail service not authenticated")
+                return None
+            
+            cached = self._get_cached_message(message_id)
+            if cached is not None:
+                return cached['body']
+            
+            message = self._message_request(self.service, message_id, full=True).execute()
+            return self._extract_email_body(message['payload'], self.MAX_BODY_BYTES)
+            
+        except Exception as e:
+            logger.error(f"Error fetching email body: {e}")
+            return None
+    
+    def _parse_message(self, message: Dict, full: bool = True) -> Dict:
+        """Build the email dict from a Gmail message resource (body None for metadata format)"""
+        # One pass over the headers; names are case-insensitive, first occurrence wins
+        headers = {}
+        for header in message['payload']['headers']:
+            headers.setdefault(header['name'].lower(), header['value'])
+        
+        # Extract email details
+        subject = headers.get('subject', 'No Subject')
+        from_email = headers.get('from', 'Unknown')
+        to_email = headers.get('to', 'Unknown')
+        date = headers.get('date', '')
+        
+        # Extract email body
+        body = self._extract_email_body(message['payload'], self.MAX_BODY_BYTES) if full else None
+        
+        return {
+            'id': message['id'],
+            'subject': subject,
+            'from': from_email,
+            'to': to_email,
+            'date': date,
+            'body': body,
+            'snippet': message.get('snippet', '')
+        }
+    
+    def _iter_decoded_text(self, data: str, max_bytes: Optional[int] = None) -> Iterator[str]:
+        """Decode base64url body data to text chunk by chunk, stopping after max_bytes"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        remaining = max_bytes
+        
+        for start in range(0, len(data), self.DECODE_CHUNK_SIZE):
+            chunk = _b64.urlsafe_b64decode(data[start:start + self.DECODE_CHUNK_SIZE])
+            if remaining is not None:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+                if remaining <= 0:
+                    # Truncated: a trailing partial UTF-8 sequence is dropped, not an error
+                    yield decoder.decode(chunk)
+                    return
+            yield decoder.decode(chunk)
+        
+        yield decoder.decode(b'', final=True)
+    
+    def _html_to_text(self, data: str, max_bytes: Optional[int] = None) -> str:
+        """Convert base64url HTML body data to plain text, dropping scripts and styles"""
+        if SelectolaxParser is not None:
+            # Decoded bytes go straight into the C parser as UTF-8: no Python-level
+            # UTF-8 decode or string join between base64 and tag stripping.
+            # Only the base64 quads covering max_bytes are decoded
+            if max_bytes is not None:
+                data = data[:-(-max_bytes // 3) * 4]
+            html_bytes = _b64.urlsafe_b64decode(data)
+            if max_bytes is not None:
+                html_bytes = html_bytes[:max_bytes]
+            tree = SelectolaxParser(html_bytes, detect_encoding=False)
+            tree.strip_tags(['script', 'style'])
+            return tree.text(separator=' ')
+        
+        # Strip tags as chunks are decoded, without building the full HTML string
+        extractor = _HTMLTextExtractor()
+        for text in self._iter_decoded_text(data, max_bytes):
+            extractor.feed(text)
+        extractor.close()
+        return extractor.text()
+    
+    def _extract_email_body(self, payload: Dict, max_bytes: Optional[int] = None) -> str:
+        """Extract email body from Gmail API payload"""
+        try:
+            if 'body' in payload and payload['body'].get('data'):
+                # Simple text email
+                data = payload['body']['data']
+                return ''.join(self._iter_decoded_text(data, max_bytes))
+            
+            elif 'parts' in payload:
+                # Multipart email
+                for part in payload['parts']:
+                    if part['mimeType'] == 'text/plain':
+                        if 'data' in part['body']:
+                            data = part['body']['data']
+                            return ''.join(self._iter_decoded_text(data, max_bytes))
+                    elif part['mimeType'] == 'text/html':
+                        if 'data' in part['body']:
+                            return self._html_to_text(part['body']['data'], max_bytes)
+            
+            return "No readable content found"
+            
+        except Exception as e:
+            logger.error(f"Error extracting email body: {e}")
+            return "Error reading email content"
+    
+    def send_email(self, to: str, subject: str, body: str, reply_to: str = None) -> bool:
+        """Send an email via Gmail API"""
+        try:
+            if not self.service:
+                logger.error("Gmail service not authenticated")
+                return False
+            
+            # Create email message
+            message = self._create_message(to, subject, body, reply_to)
+            
+            # Send email
+            sent_message = self.service.users().messages().send(
+                userId='me',
+                body=message
+            ).execute()
+            
+            logger.info(f"Email sent successfully: {sent_message['id']}")
+            return True
+            
+        except HttpError as error:
+            logger.error(f"Gmail API error sending email: {error}")
+            return False
+        except Exception as e:
+            logger.error(f"Error sending email: {e}")
+            return False
+    
+    @staticmethod
+    def _header_value(value: str) -> str:
+        """Make a header value safe for the wire: no CR/LF injection, RFC 2047 for non-ASCII"""
+        value = ' '.join(value.splitlines())
+        if value.isascii():
+            return value
+        return Header(value, 'utf-8').encode()
+    
+    def _create_message(self, to: str, subject: str, body: str, reply_to: str = None) -> Dict:
+        """Create Gmail API message format"""
+        # Plain-text RFC 5322 message built directly, without the email.mime machinery
+        raw = f"To: {self._header_value(to)}\r\nSubject: {self._header_value(subject)}\r\n"
+        if reply_to:
+            raw += f"Reply-To: {self._header_value(reply_to)}\r\n"
+        raw += (
+            "MIME-Version: 1.0\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: quoted-printable\r\n"
+            "\r\n"
+        )
+        # Quoted-printable soft-wraps long generated paragraphs under the 998-octet line limit
+        body = "\r\n".join(body.splitlines()).encode('utf-8')
+        raw += binascii.b2a_qp(body, istext=True).decode('ascii')
+        
+        # Encode message
+        raw_message = _b64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+        
+        return {'raw': raw_message}
+    
+    def mark_as_read(self, message_id: str) -> bool:
+        """Mark an email as read"""
+        try:
+            if not self.service:
+                return False
+            
+            # Remove UNREAD label
+            self.service.users().messages().modify(
+                userId='me',
+                id=message_id,
+                body={'removeLabelIds': ['UNREAD']}
+            ).execute()
+            
+            logger.info(f"Marked email {message_id} as read")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error marking email as read: {e}")
+            return False
+    
+    def add_label(self, message_id: str, label_name: str) -> bool:
+        """Add a label to an email"""
+        try:
+            if not self.service:
+                return False
+            
+            # System labels are addressed by name; others are looked up or created
+            if label_name.upper() in self.SYSTEM_LABELS:
+                label_id = label_name.upper()
+            else:
+                label_id = self._get_or_create_label(label_name)
+            
+            # Add label to message
+            self.service.users().messages().modify(
+                userId='me',
+                id=message_id,
+                body={'addLabelIds': [label_id]}
+            ).execute()
+            
+            logger.info(f"Added label '{label_name}' to email {message_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding label: {e}")
+            return False
+    
+    def _ensure_labels(self):
+        """Populate the label cache with one labels.list call (caller holds _label_lock)"""
+        if self._label_cache is None:
+            results = self.service.users().labels().list(userId='me').execute()
+            self._label_cache = {label['name']: label['id'] for label in results.get('labels', [])}
+    
+    def _get_or_create_label(self, label_name: str) -> str:
+        """Get existing label or create new one"""
+        try:
+            with self._label_lock:
+                self._ensure_labels()
+                
+                # Check if label exists
+                label_id = self._label_cache.get(label_name)
+                if label_id:
+                    return label_id
+                
+                # Create new label
+                label_object = {
+                    'name': label_name,
+                    'labelListVisibility': 'labelShow',
+                    'messageListVisibility': 'show'
+                }
+                
+                created_label = self.service.users().labels().create(
+                    userId='me',
+                    body=label_object
+                ).execute()
+                
+                self._label_cache[label_name] = created_label['id']
+                return created_label['id']
+            
+        except Exception as e:
+            logger.error(f"Error managing labels: {e}")
+            # The cache may be stale (e.g. label deleted or created elsewhere); reload next time
+            self._label_cache = None
+            return 'INBOX'  # Fallback to inbox
+    
+    def is_authenticated(self) -> bool:
+        """Check if Gmail service is authenticated"""
+        return self.service is not None
+    
+    def close(self):
+        """Shut down the fetch worker pool, letting in-flight fetches finish"""
+        self._pool.shutdown(wait=True, cancel_futures=True) 
\ No newline at end of file
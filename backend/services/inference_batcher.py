@@ -0,0 +1,84 @@
+import os
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from typing import List, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class InferenceBatcher:
+    """Dynamic batching of classification requests onto a single worker thread"""
+
+    def __init__(self, classifier, max_batch: int = 32, max_delay: float = 0.005):
+        self.classifier = classifier
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, email_text: str, email_subject: str = "") -> Future:
+        """Queue an email for classification; the future resolves to the result dict"""
+        self._ensure_worker()
+
+        future = Future()
+        self._queue.put((email_text, email_subject, future))
+        return future
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use, and again in a forked child process"""
+        pid = os.getpid()
+        if self._worker_pid == pid and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker_pid == pid and self._worker.is_alive():
+                return
+
+            # Threads do not survive fork, and neither should requests queued by the parent
+            if self._worker_pid != pid:
+                self._queue = queue.Queue()
+
+            self._worker = threading.Thread(target=self._run, name='inference-batcher', daemon=True)
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _drain(self) -> List[Tuple[str, str, Future]]:
+        """Block for one request, then collect more until max_batch or max_delay"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop: run one batched forward pass per drained batch"""
+        while True:
+            batch = [item for item in self._drain() if item[2].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            try:
+                results = self.classifier.classify_batch(
+                    [email_text for email_text, _, _ in batch],
+                    [email_subject for _, email_subject, _ in batch]
+                )
+                for (_, _, future), result in zip(batch, results):
+                    future.set_result(result)
+
+            except Exception as e:
+                logger.error(f"Error in batched classification: {e}")
+                for _, _, future in batch:
+                    future.set_exception(e)
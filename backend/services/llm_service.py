@@ -1,278 +1,550 @@
-import os
-import httpx
-import json
-from typing import Dict, Optional
-from dotenv import load_dotenv
-import logging
-
-load_dotenv()
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-class LLMService:
-    """LLM service using OpenRouter API for email response generation"""
-    
-    def __init__(self):
-        self.api_key = os.getenv('OPENROUTER_API_KEY')
-        self.base_url = "https://openrouter.ai/api/v1"
-        self.default_model = "meta-llama/llama-2-7b-chat:free"  # Free tier model
-        
-        # Response templates for different categories
-        self.response_templates = {
-            'Support': {
-                'system_prompt': """You are a professional customer support representative. 
-                Generate a helpful, empathetic response to customer support inquiries. 
-                Be specific, offer solutions, and maintain a professional yet friendly tone.""",
-                'examples': [
-                    "I understand you're experiencing [issue]. Let me help you resolve this...",
-                    "Thank you for reaching out about [issue]. Here's what we can do...",
-                    "I'm sorry to hear about [issue]. Let me assist you with..."
-                ]
-            },
-            'Sales': {
-                'system_prompt': """You are a professional sales representative. 
-                Generate an engaging, informative response to sales inquiries. 
-                Highlight benefits, provide relevant information, and encourage further engagement.""",
-                'examples': [
-                    "Thank you for your interest in [product/service]! Here's what makes us special...",
-                    "Great question about [product/service]! Let me share the key benefits...",
-                    "I'd be happy to help you with [product/service]. Here's what you should know..."
-                ]
-            },
-            'Complaints': {
-                'system_prompt': """You are a professional customer service representative handling complaints. 
-                Generate an empathetic, apologetic response that acknowledges the issue and shows commitment to resolution. 
-                Be understanding and offer concrete next steps.""",
-                'examples': [
-                    "I sincerely apologize for [issue]. This is not the experience we want you to have...",
-                    "I understand your frustration with [issue], and I want you to know we take this seriously...",
-                    "Thank you for bringing [issue] to our attention. I'm truly sorry this happened..."
-                ]
-            },
-            'Feedback': {
-                'system_prompt': """You are a professional representative responding to customer feedback. 
-                Generate a grateful, appreciative response that shows you value their input. 
-                Acknowledge their feedback and mention how it helps improve your service.""",
-                'examples': [
-                    "Thank you so much for taking the time to share your feedback about [topic]...",
-                    "We truly appreciate your thoughtful feedback regarding [topic]...",
-                    "Your feedback about [topic] is incredibly valuable to us..."
-                ]
-            },
-            'General': {
-                'system_prompt': """You are a professional representative responding to general inquiries. 
-                Generate a helpful, informative response that addresses their question clearly. 
-                Be friendly, professional, and provide useful information.""",
-                'examples': [
-                    "Thank you for your inquiry about [topic]. Here's what I can tell you...",
-                    "Great question! Let me provide you with information about [topic]...",
-                    "I'd be happy to help you with information about [topic]..."
-                ]
-            }
-        }
-    
-    def generate_response(self, email_text: str, category: str, custom_prompt: str = None) -> Optional[str]:
-        """Generate an appropriate response based on email category"""
-        try:
-            if not self.api_key:
-                logger.warning("OpenRouter API key not found. Using template responses.")
-                return self._generate_template_response(email_text, category)
-            
-            # Get category-specific template
-            template = self.response_templates.get(category, self.response_templates['General'])
-            
-            # Build the prompt
-            if custom_prompt:
-                system_prompt = custom_prompt
-            else:
-                system_prompt = template['system_prompt']
-            
-            user_prompt = f"""Please generate a professional email response to the following customer email:
-
-Customer Email:
-{email_text}
-
-Category: {category}
-
-Requirements:
-- Keep the response under 150 words
-- Be professional yet friendly
-- Address the customer's specific concerns
-- Offer helpful solutions or information
-- Maintain the appropriate tone for {category} emails
-
-Please provide only the response text, no additional formatting."""
-            
-            # Call OpenRouter API
-            response = self._call_openrouter_api(system_prompt, user_prompt)
-            
-            if response:
-                logger.info(f"Generated {category} response successfully")
-                return response
-            else:
-                logger.warning("OpenRouter API call failed, falling back to template")
-                return self._generate_template_response(email_text, category)
-                
-        except Exception as e:
-            logger.error(f"Error generating response: {e}")
-            return self._generate_template_response(email_text, category)
-    
-    def _call_openrouter_api(self, system_prompt: str, user_prompt: str) -> Optional[str]:
-        """Make API call to OpenRouter"""
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://smart-email-classifier.com",
-                "X-Title": "Smart Email Classifier"
-            }
-            
-            payload = {
-                "model": self.default_model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "max_tokens": 300,
-                "temperature": 0.7,
-                "top_p": 0.9
-            }
-            
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data['choices'][0]['message']['content'].strip()
-                else:
-                    logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error calling OpenRouter API: {e}")
-            return None
-    
-    def _generate_template_response(self, email_text: str, category: str) -> str:
-        """Generate a template-based response when LLM is unavailable"""
-        template = self.response_templates.get(category, self.response_templates['General'])
-        
-        # Simple keyword-based response generation
-        email_lower = email_text.lower()
-        
-        if category == 'Support':
-            if any(word in email_lower for word in ['help', 'issue', 'problem']):
-                return """Thank you for reaching out. I understand you're experiencing an issue, and I'm here to help resolve it. 
-
-Could you please provide more specific details about what you're encountering? This will help me assist you more effectively.
-
-In the meantime, you might find helpful information in our knowledge base or FAQ section.
-
-Best regards,
-Customer Support Team"""
-            else:
-                return """Thank you for contacting our support team. I'm here to help you with any questions or concerns you may have.
-
-Please let me know how I can assist you today, and I'll do my best to provide a quick and helpful solution.
-
-Best regards,
-Customer Support Team"""
-        
-        elif category == 'Sales':
-            if any(word in email_lower for word in ['price', 'cost', 'quote']):
-                return """Thank you for your interest in our products/services! I'd be happy to provide you with pricing information and answer any questions you may have.
-
-To give you the most accurate quote, could you share a bit more about your specific needs? This will help me provide you with the best options and pricing.
-
-I'll follow up with detailed information shortly.
-
-Best regards,
-Sales Team"""
-            else:
-                return """Thank you for your inquiry! I'm excited to tell you more about our products/services and how they can benefit you.
-
-I'd love to schedule a brief call to discuss your needs in detail and show you the perfect solution. When would be a convenient time for you?
-
-Best regards,
-Sales Team"""
-        
-        elif category == 'Complaints':
-            return """I sincerely apologize for the negative experience you've had. This is not the level of service we strive to provide, and I want you to know we take your feedback very seriously.
-
-I'm committed to resolving this issue for you. Could you please provide additional details so I can investigate and take appropriate action?
-
-I'll personally follow up with you within 24 hours to ensure we address your concerns completely.
-
-Best regards,
-Customer Service Manager"""
-        
-        elif category == 'Feedback':
-            return """Thank you so much for taking the time to share your feedback with us! We truly value input from our customers as it helps us continuously improve our products and services.
-
-Your insights are incredibly valuable, and I've shared them with our team for review. We're committed to using this feedback to enhance the customer experience.
-
-We appreciate you being part of our community and helping us grow.
-
-Best regards,
-Customer Experience Team"""
-        
-        else:  # General
-            return """Thank you for your inquiry! I'm here to help you with any questions or information you may need.
-
-I'll do my best to provide you with a comprehensive and helpful response. If you need any clarification or have additional questions, please don't hesitate to ask.
-
-Best regards,
-Customer Service Team"""
-    
-    def update_response_template(self, category: str, system_prompt: str, examples: list = None):
-        """Update response templates for customization"""
-        if category in self.response_templates:
-            self.response_templates[category]['system_prompt'] = system_prompt
-            if examples:
-                self.response_templates[category]['examples'] = examples
-            logger.info(f"Updated response template for {category}")
-    
-    def get_available_models(self) -> list:
-        """Get list of available OpenRouter models"""
-        try:
-            if not self.api_key:
-                return []
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(
-                    f"{self.base_url}/models",
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return [model['id'] for model in data.get('data', [])]
-                else:
-                    logger.error(f"Error fetching models: {response.status_code}")
-                    return []
-                    
-        except Exception as e:
-            logger.error(f"Error getting available models: {e}")
-            return []
-    
-    def test_connection(self) -> bool:
-        """Test OpenRouter API connection"""
-        try:
-            if not self.api_key:
-                return False
-            
-            # Try to get available models
-            models = self.get_available_models()
-            return len(models) > 0
-            
-        except Exception as e:
-            logger.error(f"Connection test failed: {e}")
-            return False 
\ No newline at end of file
+import os
+import httpx
+import json
+import asyncio
+import re
+import time
+import random
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+import logging
+
+try:
+    import h2
+except ImportError:  # Optional dependency, falls back to HTTP/1.1 keep-alive
+    h2 = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, JSON falls back to the stdlib codec
+    orjson = None
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'[a-z]+')
+
+# JSON codecs working on bytes, so request and response bodies skip the str round-trip
+_json_loads = orjson.loads if orjson is not None else json.loads
+_json_dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode('utf-8'))
+
+# Responses worth retrying: rate limited or transient upstream failures
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# User prompt for a single email, filled with str.format
+USER_PROMPT_TEMPLATE = """Please generate a professional email response to the following customer email:
+
+Customer Email:
+{email_text}
+
+Category: {category}
+
+Requirements:
+- Keep the response under 150 words
+- Be professional yet friendly
+- Address the customer's specific concerns
+- Offer helpful solutions or information
+- Maintain the appropriate tone for {category} emails
+
+Please provide only the response text, no additional formatting."""
+
+# Keywords that select the more specific canned response for a category
+TEMPLATE_KEYWORDS = {
+    'Support': frozenset({'help', 'helps', 'helping', 'issue', 'issues', 'problem', 'problems'}),
+    'Sales': frozenset({'price', 'prices', 'pricing', 'cost', 'costs', 'quote', 'quotes'})
+}
+
+# Canned responses keyed by (category, keyword matched)
+TEMPLATE_RESPONSES = {
+    ('Support', True): """Thank you for reaching out. I understand you're experiencing an issue, and I'm here to help resolve it. 
+
+Could you please provide more specific details about what you're encountering? This will help me assist you more effectively.
+
+In the meantime, you might find helpful information in our knowledge base or FAQ section.
+
+Best regards,
+Customer Support Team""",
+    ('Support', False): """Thank you for contacting our support team. I'm here to help you with any questions or concerns you may have.
+
+Please let me know how I can assist you today, and I'll do my best to provide a quick and helpful solution.
+
+Best regards,
+Customer Support Team""",
+    ('Sales', True): """Thank you for your interest in our products/services! I'd be happy to provide you with pricing information and answer any questions you may have.
+
+To give you the most accurate quote, could you share a bit more about your specific needs? This will help me provide you with the best options and pricing.
+
+I'll follow up with detailed information shortly.
+
+Best regards,
+Sales Team""",
+    ('Sales', False): """Thank you for your inquiry! I'm excited to tell you more about our products/services and how they can benefit you.
+
+I'd love to schedule a brief call to discuss your needs in detail and show you the perfect solution. When would be a convenient time for you?
+
+Best regards,
+Sales Team""",
+    ('Complaints', False): """I sincerely apologize for the negative experience you've had. This is not the level of service we strive to provide, and I want you to know we take your feedback very seriously.
+
+I'm committed to resolving this issue for you. Could you please provide additional details so I can investigate and take appropriate action?
+
+I'll personally follow up with you within 24 hours to ensure we address your concerns completely.
+
+Best regards,
+Customer Service Manager""",
+    ('Feedback', False): """Thank you so much for taking the time to share your feedback with us! We truly value input from our customers as it helps us continuously improve our products and services.
+
+Your insights are incredibly valuable, and I've shared them with our team for review. We're committed to using this feedback to enhance the customer experience.
+
+We appreciate you being part of our community and helping us grow.
+
+Best regards,
+Customer Experience Team""",
+    ('General', False): """Thank you for your inquiry! I'm here to help you with any questions or information you may need.
+
+I'll do my best to provide you with a comprehensive and helpful response. If you need any clarification or have additional questions, please don't hesitate to ask.
+
+Best regards,
+Customer Service Team"""
+}
+
+class _RateLimiter:
+    """Sliding-window limiter: at most max_requests request starts in any period seconds"""
+    
+    def __init__(self, max_requests: int, period: float):
+        self.max_requests = max_requests
+        self.period = period
+        self._starts = deque()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Claim the next request slot and return the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            while self._starts and self._starts[0] <= now - self.period:
+                self._starts.popleft()
+            
+            if len(self._starts) < self.max_requests:
+                start = now
+            else:
+                start = self._starts[-self.max_requests] + self.period
+            self._starts.append(start)
+            return start - now
+
+class LLMService:
+    """LLM service using OpenRouter API for email response generation"""
+    
+    # Maximum in-flight OpenRouter requests in generate_responses
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Per-process request budget, kept under the provider rate limit to avoid 429s
+    RATE_LIMIT_REQUESTS = 500
+    RATE_LIMIT_PERIOD = 60.0  # seconds
+    
+    # Retries with exponential backoff and jitter for 429/5xx and network errors
+    MAX_ATTEMPTS = 4
+    RETRY_INITIAL_DELAY = 0.5  # seconds
+    RETRY_MAX_DELAY = 8.0  # seconds; a longer Retry-After falls back to the template
+    
+    def __init__(self):
+        self.api_key = os.getenv('OPENROUTER_API_KEY')
+        self.base_url = "https://openrouter.ai/api/v1"
+        self.default_model = "meta-llama/llama-2-7b-chat:free"  # Free tier model
+        
+        # Constant request headers, set once on the client
+        self._default_headers = {
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://smart-email-classifier.com",
+            "X-Title": "Smart Email Classifier"
+        }
+        if self.api_key:
+            self._default_headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        # One pooled keep-alive client for the service lifetime, so repeated calls
+        # (e.g. one per email in a Gmail fetch) skip the TCP+TLS handshake;
+        # HTTP/2 multiplexes concurrent calls over a single connection
+        self._client = httpx.Client(**self._client_options())
+        self._rate_limiter = _RateLimiter(self.RATE_LIMIT_REQUESTS, self.RATE_LIMIT_PERIOD)
+        
+        # Response templates for different categories
+        self.response_templates = {
+            'Support': {
+                'system_prompt': """You are a professional customer support representative. 
+                Generate a helpful, empathetic response to customer support inquiries. 
+                Be specific, offer solutions, and maintain a professional yet friendly tone.""",
+                'examples': [
+                    "I understand you're experiencing [issue]. Let me help you resolve this...",
+                    "Thank you for reaching out about [issue]. Here's what we can do...",
+                    "I'm sorry to hear about [issue]. Let me assist you with..."
+                ]
+            },
+            'Sales': {
+                'system_prompt': """You are a professional sales representative. 
+                Generate an engaging, informative response to sales inquiries. 
+                Highlight benefits, provide relevant information, and encourage further engagement.""",
+                'examples': [
+                    "Thank you for your interest in [product/service]! Here's what makes us special...",
+                    "Great question about [product/service]! Let me share the key benefits...",
+                    "I'd be happy to help you with [product/service]. Here's what you should know..."
+                ]
+            },
+            'Complaints': {
+                'system_prompt': """You are a professional customer service representative handling complaints. 
+                Generate an empathetic, apologetic response that acknowledges the issue and shows commitment to resolution. 
+                Be understanding and offer concrete next steps.""",
+                'examples': [
+                    "I sincerely apologize for [issue]. This is not the experience we want you to have...",
+                    "I understand your frustration with [issue], and I want you to know we take this seriously...",
+                    "Thank you for bringing [issue] to our attention. I'm truly sorry this happened..."
+                ]
+            },
+            'Feedback': {
+                'system_prompt': """You are a professional representative responding to customer feedback. 
+                Generate a grateful, appreciative response that shows you value their input. 
+                Acknowledge their feedback and mention how it helps improve your service.""",
+                'examples': [
+                    "Thank you so much for taking the time to share your feedback about [topic]...",
+                    "We truly appreciate your thoughtful feedback regarding [topic]...",
+                    "Your feedback about [topic] is incredibly valuable to us..."
+                ]
+            },
+            'General': {
+                'system_prompt': """You are a professional representative responding to general inquiries. 
+                Generate a helpful, informative response that addresses their question clearly. 
+                Be friendly, professional, and provide useful information.""",
+                'examples': [
+                    "Thank you for your inquiry about [topic]. Here's what I can tell you...",
+                    "Great question! Let me provide you with information about [topic]...",
+                    "I'd be happy to help you with information about [topic]..."
+                ]
+            }
+        }
+    
+    def generate_response(self, email_text: str, category: str, custom_prompt: str = None) -> Optional[str]:
+        """Generate an appropriate response based on email category"""
+        try:
+            if not self.api_key:
+                logger.warning("OpenRouter API key not found. Using template responses.")
+                return self._generate_template_response(email_text, category)
+            
+            system_prompt, user_prompt = self._build_prompts(email_text, category, custom_prompt)
+            
+            # Call OpenRouter API
+            response = self._call_openrouter_api(system_prompt, user_prompt)
+            
+            if response:
+                logger.info(f"Generated {category} response successfully")
+                return response
+            else:
+                logger.warning("OpenRouter API call failed, falling back to template")
+                return self._generate_template_response(email_text, category)
+                
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return self._generate_template_response(email_text, category)
+    
+    async def generate_responses(self, items: List[Tuple[str, str]], custom_prompt: str = None) -> List[Optional[str]]:
+        """Generate responses for (email_text, category) pairs with concurrent API calls, in input order"""
+        if not self.api_key:
+            logger.warning("OpenRouter API key not found. Using template responses.")
+            return [self._generate_template_response(email_text, category) for email_text, category in items]
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        # AsyncClient is bound to the running event loop, so each call gets its own pool
+        async with httpx.AsyncClient(**self._client_options()) as client:
+            responses = await asyncio.gather(*(
+                self._generate_one_async(client, semaphore, email_text, category, custom_prompt)
+                for email_text, category in items
+            ))
+        
+        logger.info(f"Generated {len(responses)} responses")
+        return responses
+    
+    async def generate_responses_batched(self, items: List[Tuple[str, str]], rows_per_prompt: int = 4) -> List[Optional[str]]:
+        """Generate responses with up to rows_per_prompt same-category emails per API call, in input order"""
+        if not self.api_key:
+            logger.warning("OpenRouter API key not found. Using template responses.")
+            return [self._generate_template_response(email_text, category) for email_text, category in items]
+        
+        # Group by category so each request shares one system prompt
+        groups = {}
+        for i, (_, category) in enumerate(items):
+            groups.setdefault(category, []).append(i)
+        chunks = [
+            indices[start:start + rows_per_prompt]
+            for indices in groups.values()
+            for start in range(0, len(indices), rows_per_prompt)
+        ]
+        
+        responses = [None] * len(items)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        async with httpx.AsyncClient(**self._client_options()) as client:
+            
+            async def generate_chunk(indices: List[int]):
+                chunk_items = [items[i] for i in indices]
+                chunk_responses = None
+                if len(chunk_items) > 1:
+                    async with semaphore:
+                        chunk_responses = await self._call_openrouter_api_batched_async(client, chunk_items)
+                
+                # Single email, or the model did not return one response per email
+                if chunk_responses is None:
+                    chunk_responses = await asyncio.gather(*(
+                        self._generate_one_async(client, semaphore, email_text, category)
+                        for email_text, category in chunk_items
+                    ))
+                
+                for i, response in zip(indices, chunk_responses):
+                    responses[i] = response
+            
+            await asyncio.gather(*(generate_chunk(indices) for indices in chunks))
+        
+        logger.info(f"Generated {len(responses)} responses in {len(chunks)} prompts")
+        return responses
+    
+    async def _generate_one_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                  email_text: str, category: str, custom_prompt: str = None) -> str:
+        """Generate one response on an async client, falling back to the template"""
+        try:
+            system_prompt, user_prompt = self._build_prompts(email_text, category, custom_prompt)
+            async with semaphore:
+                response = await self._call_openrouter_api_async(client, system_prompt, user_prompt)
+            
+            if response:
+                return response
+            logger.warning("OpenRouter API call failed, falling back to template")
+            
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+        return self._generate_template_response(email_text, category)
+    
+    def _client_options(self) -> Dict:
+        """Shared settings for the sync and async HTTP clients"""
+        return {
+            'http2': h2 is not None,
+            'timeout': 30.0,
+            'limits': httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            'headers': self._default_headers
+        }
+    
+    def _build_prompts(self, email_text: str, category: str, custom_prompt: str = None) -> Tuple[str, str]:
+        """Build the system and user prompts for one email"""
+        # Get category-specific template
+        template = self.response_templates.get(category, self.response_templates['General'])
+        
+        # Build the prompt
+        if custom_prompt:
+            system_prompt = custom_prompt
+        else:
+            system_prompt = template['system_prompt']
+        
+        user_prompt = USER_PROMPT_TEMPLATE.format(email_text=email_text, category=category)
+        
+        return system_prompt, user_prompt
+    
+    def _build_payload(self, system_prompt: str, user_prompt: str) -> Dict:
+        """Build the chat completion request body"""
+        return {
+            "model": self.default_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "max_tokens": 300,
+            "temperature": 0.7,
+            "top_p": 0.9
+        }
+    
+    def _parse_completion(self, response: httpx.Response) -> Optional[str]:
+        """Extract the generated text from a chat completion response"""
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            return data['choices'][0]['message']['content'].strip()
+        else:
+            logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
+            return None
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Seconds to wait before the next attempt: Retry-After if given, else exponential backoff"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form, use backoff instead
+        
+        delay = self.RETRY_INITIAL_DELAY * 2 ** attempt + random.uniform(0, self.RETRY_INITIAL_DELAY)
+        return min(self.RETRY_MAX_DELAY, delay)
+    
+    def _should_retry(self, attempt: int, response: Optional[httpx.Response]) -> Optional[float]:
+        """Return the backoff delay if another attempt should be made, else None"""
+        if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        if attempt + 1 >= self.MAX_ATTEMPTS:
+            return None
+        
+        delay = self._retry_delay(attempt, response)
+        if delay > self.RETRY_MAX_DELAY:
+            return None
+        
+        status = response.status_code if response is not None else 'network error'
+        logger.warning(f"OpenRouter API {status}, retrying in {delay:.1f}s")
+        return delay
+    
+    def _post_chat_completion(self, payload: Dict) -> Optional[str]:
+        """POST a chat completion, retrying rate limits and transient failures"""
+        body = _json_dumps(payload)
+        for attempt in range(self.MAX_ATTEMPTS):
+            time.sleep(self._rate_limiter.reserve())
+            
+            response = None
+            try:
+                response = self._client.post(f"{self.base_url}/chat/completions", content=body)
+            except httpx.TransportError as e:
+                logger.warning(f"OpenRouter API request failed: {e}")
+            
+            delay = self._should_retry(attempt, response)
+            if delay is None:
+                return self._parse_completion(response) if response is not None else None
+            time.sleep(delay)
+    
+    async def _post_chat_completion_async(self, client: httpx.AsyncClient, payload: Dict) -> Optional[str]:
+        """POST a chat completion on an async client, retrying rate limits and transient failures"""
+        body = _json_dumps(payload)
+        for attempt in range(self.MAX_ATTEMPTS):
+            await asyncio.sleep(self._rate_limiter.reserve())
+            
+            response = None
+            try:
+                response = await client.post(f"{self.base_url}/chat/completions", content=body)
+            except httpx.TransportError as e:
+                logger.warning(f"OpenRouter API request failed: {e}")
+            
+            delay = self._should_retry(attempt, response)
+            if delay is None:
+                return self._parse_completion(response) if response is not None else None
+            await asyncio.sleep(delay)
+    
+    def _call_openrouter_api(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+        """Make API call to OpenRouter"""
+        try:
+            return self._post_chat_completion(self._build_payload(system_prompt, user_prompt))
+                    
+        except Exception as e:
+            logger.error(f"Error calling OpenRouter API: {e}")
+            return None
+    
+    async def _call_openrouter_api_async(self, client: httpx.AsyncClient, system_prompt: str, user_prompt: str) -> Optional[str]:
+        """Make API call to OpenRouter on an async client"""
+        try:
+            return await self._post_chat_completion_async(client, self._build_payload(system_prompt, user_prompt))
+            
+        except Exception as e:
+            logger.error(f"Error calling OpenRouter API: {e}")
+            return None
+    
+    async def _call_openrouter_api_batched_async(self, client: httpx.AsyncClient,
+                                                 items: List[Tuple[str, str]]) -> Optional[List[str]]:
+        """Ask for responses to several same-category emails as one JSON array"""
+        try:
+            category = items[0][1]
+            template = self.response_templates.get(category, self.response_templates['General'])
+            numbered_emails = "\n\n".join(f"{n}) {email_text}" for n, (email_text, _) in enumerate(items, 1))
+            
+            user_prompt = f"""Please generate a professional email response to each of the following {len(items)} customer emails:
+
+Customer Emails:
+{numbered_emails}
+
+Category: {category}
+
+Requirements:
+- Keep each response under 150 words
+- Be professional yet friendly
+- Address each customer's specific concerns
+- Offer helpful solutions or information
+- Maintain the appropriate tone for {category} emails
+
+Return only a JSON object of the form {{"responses": ["...", "..."]}} with exactly {len(items)} response strings, in the same order as the emails."""
+            
+            payload = self._build_payload(template['system_prompt'], user_prompt)
+            payload["max_tokens"] *= len(items)
+            payload["response_format"] = {"type": "json_object"}
+            
+            content = await self._post_chat_completion_async(client, payload)
+            if content is None:
+                return None
+            
+            parsed = _json_loads(content)
+            responses = parsed.get('responses') if isinstance(parsed, dict) else parsed
+            if (not isinstance(responses, list) or len(responses) != len(items)
+                    or not all(isinstance(r, str) and r.strip() for r in responses)):
+                logger.warning("Batched response did not match the emails, retrying them individually")
+                return None
+            
+            return [r.strip() for r in responses]
+            
+        except Exception as e:
+            logger.error(f"Error calling OpenRouter API with batched prompt: {e}")
+            return None
+    
+    def _generate_template_response(self, email_text: str, category: str) -> str:
+        """Generate a template-based response when LLM is unavailable"""
+        # Simple keyword-based response generation
+        keywords = TEMPLATE_KEYWORDS.get(category)
+        matched = keywords is not None and not keywords.isdisjoint(_WORD_RE.findall(email_text.lower()))
+        
+        return TEMPLATE_RESPONSES.get((category, matched), TEMPLATE_RESPONSES[('General', False)])
+    
+    def update_response_template(self, category: str, system_prompt: str, examples: list = None):
+        """Update response templates for customization"""
+        if category in self.response_templates:
+            self.response_templates[category]['system_prompt'] = system_prompt
+            if examples:
+                self.response_templates[category]['examples'] = examples
+            logger.info(f"Updated response template for {category}")
+    
+    def get_available_models(self) -> list:
+        """Get list of available OpenRouter models"""
+        try:
+            if not self.api_key:
+                return []
+            
+            response = self._client.get(
+                f"{self.base_url}/models",
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                data = _json_loads(response.content)
+                return [model['id'] for model in data.get('data', [])]
+            else:
+                logger.error(f"Error fetching models: {response.status_code}")
+                return []
+                    
+        except Exception as e:
+            logger.error(f"Error getting available models: {e}")
+            return []
+    
+    def test_connection(self) -> bool:
+        """Test OpenRouter API connection"""
+        try:
+            if not self.api_key:
+                return False
+            
+            # Try to get available models
+            models = self.get_available_models()
+            return len(models) > 0
+            
+        except Exception as e:
+            logger.error(f"Connection test failed: {e}")
+            return False 
+    
+    def close(self):
+        """Close the pooled HTTP client"""
+        self._client.close()
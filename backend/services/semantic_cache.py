@@ -0,0 +1,200 @@
+import os
+import json
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union
+import logging
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional dependency, cache is disabled without it
+    SentenceTransformer = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """Embedding-keyed cache of classification results for near-duplicate emails"""
+
+    def __init__(self, cache_path: str = None,
+                 model_name: str = 'sentence-transformers/all-MiniLM-L6-v2',
+                 threshold: float = 0.95, max_size: int = 10_000,
+                 embedding_lru_size: int = 4096, model_version: str = None):
+        self.cache_path = cache_path
+        
+        # Version of the saved classifier weights the cached results came from; entries
+        # are only persisted and reloaded for saved weights of the same version
+        self.model_version = model_version
+        self.threshold = threshold
+        self.max_size = max_size
+        self.encoder = None
+
+        # Ring buffer of L2-normalized embeddings with a parallel list of results;
+        # once full, the oldest entry is overwritten (FIFO eviction)
+        self.embeddings = None
+        self.results = []
+        self._next = 0
+        self._lock = threading.Lock()
+        
+        # Exact-text LRU in front of the encoder for repeated emails
+        self.embedding_lru_size = embedding_lru_size
+        self._embedding_lru = OrderedDict()
+
+        self._load_encoder(model_name)
+        if self.encoder is not None:
+            self.load()
+
+    def _load_encoder(self, model_name: str):
+        """Load the sentence embedding model on CPU"""
+        if SentenceTransformer is None:
+            logger.info("sentence-transformers not installed, semantic cache disabled")
+            return
+
+        try:
+            self.encoder = SentenceTransformer(model_name, device='cpu')
+            dim = self.encoder.get_sentence_embedding_dimension()
+            self.embeddings = np.zeros((self.max_size, dim), dtype=np.float32)
+            logger.info("Semantic cache encoder loaded")
+        except Exception as e:
+            logger.error(f"Error loading semantic cache encoder: {e}")
+            self.encoder = None
+
+    def is_enabled(self) -> bool:
+        """Check if the cache can be used"""
+        return self.encoder is not None
+
+    def embed(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """Compute L2-normalized embeddings for one or more preprocessed texts"""
+        if isinstance(texts, str):
+            return self.embed([texts])[0]
+        
+        embeddings = [None] * len(texts)
+        misses = []
+        with self._lock:
+            for i, text in enumerate(texts):
+                embedding = self._embedding_lru.get(text)
+                if embedding is None:
+                    misses.append(i)
+                else:
+                    self._embedding_lru.move_to_end(text)
+                    embeddings[i] = embedding
+        
+        # Encode only texts not seen recently, as one batch
+        if misses:
+            missing_texts = list(dict.fromkeys(texts[i] for i in misses))
+            encoded = self.encoder.encode(
+                missing_texts,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+            encoded_by_text = dict(zip(missing_texts, encoded))
+            
+            with self._lock:
+                for i in misses:
+                    embeddings[i] = encoded_by_text[texts[i]]
+                self._embedding_lru.update(encoded_by_text)
+                while len(self._embedding_lru) > self.embedding_lru_size:
+                    self._embedding_lru.popitem(last=False)
+        
+        return np.stack(embeddings)
+
+    def lookup(self, embedding: np.ndarray) -> Optional[Dict]:
+        """Return the cached result for the most similar entry above the threshold"""
+        with self._lock:
+            size = len(self.results)
+            if size == 0:
+                return None
+
+            # Cosine similarity against every cached entry in a single GEMV
+            sims = self.embeddings[:size] @ embedding
+            best = int(np.argmax(sims))
+            if sims[best] > self.threshold:
+                return dict(self.results[best])
+        return None
+
+    def add(self, embedding: np.ndarray, result: Dict):
+        """Store a classification result, evicting the oldest entry when full"""
+        with self._lock:
+            self.embeddings[self._next] = embedding
+            if len(self.results) < self.max_size:
+                self.results.append(dict(result))
+            else:
+                self.results[self._next] = dict(result)
+            self._next = (self._next + 1) % self.max_size
+
+    def clear(self, model_version: str = None):
+        """Drop all cached entries (e.g. after the classifier is retrained) and tag new ones with model_version"""
+        with self._lock:
+            self.results = []
+            self._next = 0
+            self.model_version = model_version
+
+    def save(self) -> bool:
+        """Persist the cache to disk in insertion order"""
+        if not self.is_enabled() or not self.cache_path or self.model_version is None:
+            return False
+
+        try:
+            with self._lock:
+                model_version = self.model_version
+                size = len(self.results)
+                order = (np.arange(size) + self._next) % size if size == self.max_size else np.arange(size)
+                embeddings = self.embeddings[order]
+                results = [self.results[i] for i in order]
+
+            # Write then rename, so concurrent savers never leave a truncated file
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, embeddings=embeddings, results=np.array(json.dumps(results)),
+                         model_version=np.array(model_version))
+            os.replace(tmp_path, self.cache_path)
+
+            logger.info(f"Semantic cache saved ({size} entries)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving semantic cache: {e}")
+            return False
+
+    def load(self) -> bool:
+        """Load a previously persisted cache from disk"""
+        try:
+            if not self.cache_path or not os.path.exists(self.cache_path) or self.model_version is None:
+                return False
+
+            with np.load(self.cache_path, allow_pickle=False) as saved:
+                saved_version = str(saved['model_version']) if 'model_version' in saved.files else None
+                embeddings = saved['embeddings']
+                results = json.loads(str(saved['results']))
+
+            # Results predicted by other weights would be served as if from the current model
+            if saved_version != self.model_version:
+                logger.info("Semantic cache is from another model version, discarding it")
+                os.remove(self.cache_path)
+                return False
+
+            if embeddings.shape[1] != self.embeddings.shape[1]:
+                logger.warning("Semantic cache dimension mismatch, ignoring saved cache")
+                return False
+
+            # Keep only the newest entries if the saved cache is larger than max_size
+            embeddings = embeddings[-self.max_size:]
+            results = results[-self.max_size:]
+
+            with self._lock:
+                size = len(results)
+                self.embeddings[:size] = embeddings
+                self.results = results
+                self._next = size % self.max_size
+
+            logger.info(f"Semantic cache loaded ({size} entries)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading semantic cache: {e}")
+            return False
+
+    def __len__(self):
+        return len(self.results)
@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.classifier_service import EmailClassifier
+
+
+def preprocess(text):
+    # preprocess_text needs no model state, so skip loading BERT
+    return EmailClassifier.__new__(EmailClassifier).preprocess_text(text)
+
+
+def test_body_opening_with_thanks_is_kept():
+    text = ("Subj Thanks for the quick reply. My order arrived broken and I need a refund.\n"
+            "Best regards,\nJo")
+    assert preprocess(text) == 'subj thanks for the quick reply. my order arrived broken and i need a refund. '
+
+
+def test_trailing_signature_is_stripped():
+    assert preprocess("Please fix the login error.\nThanks,\nJo Smith") == 'please fix the login error. '
+
+
+def test_signoff_needs_word_boundary():
+    assert preprocess("Order for Thanksgiving") == 'order for thanksgiving'
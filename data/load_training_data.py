@@ -1,142 +1,162 @@
-#!/usr/bin/env python3
-"""
-Training Data Loader for Smart Email Classifier
-Loads sample training data into the system for initial model training
-"""
-
-import json
-import csv
-import os
-import sys
-from pathlib import Path
-
-# Add backend to path for imports
-backend_path = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
-
-try:
-    from models.email_model import Email
-    from services.classifier_service import EmailClassifier
-    from app import db, app
-except ImportError as e:
-    print(f"Error importing backend modules: {e}")
-    print("Make sure you're running this from the project root directory")
-    sys.exit(1)
-
-def load_json_data(file_path):
-    """Load training data from JSON file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error loading JSON file {file_path}: {e}")
-        return []
-
-def load_csv_data(file_path):
-    """Load training data from CSV file"""
-    try:
-        data = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert confidence to float
-                row['confidence'] = float(row['confidence'])
-                data.append(row)
-        return data
-    except Exception as e:
-        print(f"Error loading CSV file {file_path}: {e}")
-        return []
-
-def create_training_examples(data):
-    """Create training examples for the classifier"""
-    examples = []
-    for item in data:
-        # Combine subject and body for training
-        text = f"{item['subject']} {item['body']}"
-        examples.append({
-            'text': text,
-            'category': item['category'],
-            'confidence': item['confidence']
-        })
-    return examples
-
-def main():
-    """Main function to load training data"""
-    print("🧠 Loading Training Data for Smart Email Classifier")
-    print("=" * 50)
-    
-    # Get data directory
-    data_dir = Path(__file__).parent
-    json_file = data_dir / "training_emails.json"
-    csv_file = data_dir / "training_emails.csv"
-    extended_file = data_dir / "extended_training_data.json"
-    
-    # Load all available data
-    all_data = []
-    
-    if json_file.exists():
-        print(f"📁 Loading {json_file.name}...")
-        data = load_json_data(json_file)
-        all_data.extend(data)
-        print(f"   Loaded {len(data)} examples")
-    
-    if csv_file.exists():
-        print(f"📁 Loading {csv_file.name}...")
-        data = load_csv_data(csv_file)
-        all_data.extend(data)
-        print(f"   Loaded {len(data)} examples")
-    
-    if extended_file.exists():
-        print(f"📁 Loading {extended_file.name}...")
-        data = load_json_data(extended_file)
-        all_data.extend(data)
-        print(f"   Loaded {len(data)} examples")
-    
-    if not all_data:
-        print("❌ No training data found!")
-        return
-    
-    # Remove duplicates based on id
-    unique_data = {item['id']: item for item in all_data}.values()
-    all_data = list(unique_data)
-    
-    print(f"\n📊 Total unique training examples: {len(all_data)}")
-    
-    # Show category distribution
-    categories = {}
-    for item in all_data:
-        cat = item['category']
-        categories[cat] = categories.get(cat, 0) + 1
-    
-    print("\n📈 Category Distribution:")
-    for cat, count in categories.items():
-        print(f"   {cat}: {count} examples")
-    
-    # Create training examples
-    training_examples = create_training_examples(all_data)
-    
-    print(f"\n🎯 Created {len(training_examples)} training examples")
-    
-    # Save training data summary
-    summary = {
-        'total_examples': len(training_examples),
-        'categories': categories,
-        'examples': training_examples[:5]  # Save first 5 as sample
-    }
-    
-    summary_file = data_dir / "training_summary.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n💾 Training summary saved to: {summary_file}")
-    
-    # Instructions for using the data
-    print("\n🚀 Next Steps:")
-    print("1. Start the backend server: cd backend && python app.py")
-    print("2. Use the dashboard to retrain the model with this data")
-    print("3. Or call the API endpoint: POST /api/model/retrain")
-    
-    print("\n✅ Training data loading complete!")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Training Data Loader for Smart Email Classifier
+Loads sample training data into the system for initial model training
+"""
+
+import json
+import csv
+import os
+import sys
+from pathlib import Path
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, JSON files are parsed whole instead of streamed
+    ijson = None
+
+# Add backend to path for imports
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+try:
+    from models.email_model import Email
+    from services.classifier_service import EmailClassifier
+    from app import db, app
+except ImportError as e:
+    print(f"Error importing backend modules: {e}")
+    print("Make sure you're running this from the project root directory")
+    sys.exit(1)
+
+def load_json_data(file_path):
+    """Load training data from JSON file"""
+    try:
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading JSON file {file_path}: {e}")
+        return []
+
+def load_csv_data(file_path):
+    """Load training data from CSV file"""
+    return list(iter_csv_data(file_path))
+
+def iter_json_data(file_path):
+    """Stream training examples from a JSON array file"""
+    if ijson is None:
+        yield from load_json_data(file_path)
+        return
+    
+    try:
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    except Exception as e:
+        print(f"Error loading JSON file {file_path}: {e}")
+
+def iter_csv_data(file_path):
+    """Stream training examples from a CSV file"""
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                # Convert confidence to float
+                row['confidence'] = float(row['confidence'])
+                yield row
+    except Exception as e:
+        print(f"Error loading CSV file {file_path}: {e}")
+
+def create_training_examples(df):
+    """Create training examples for the classifier"""
+    # Combine subject and body for training (one vectorized concat over the columns)
+    text = df['subject'] + ' ' + df['body']
+    return pd.DataFrame({
+        'text': text,
+        'category': df['category'],
+        'confidence': df['confidence']
+    })
+
+def main():
+    """Main function to load training data"""
+    print("🧠 Loading Training Data for Smart Email Classifier")
+    print("=" * 50)
+    
+    # Get data directory
+    data_dir = Path(__file__).parent
+    json_file = data_dir / "training_emails.json"
+    csv_file = data_dir / "training_emails.csv"
+    extended_file = data_dir / "extended_training_data.json"
+    
+    # Load all available data, removing duplicates by id as rows stream in
+    # (a later row with the same id replaces the earlier one)
+    unique_data = {}
+    sources = [
+        (json_file, iter_json_data),
+        (csv_file, iter_csv_data),
+        (extended_file, iter_json_data)
+    ]
+    
+    for file_path, iter_data in sources:
+        if file_path.exists():
+            print(f"📁 Loading {file_path.name}...")
+            count = 0
+            for item in iter_data(file_path):
+                unique_data[item['id']] = item
+                count += 1
+            print(f"   Loaded {count} examples")
+    
+    if not unique_data:
+        print("❌ No training data found!")
+        return
+    
+    df = pd.DataFrame.from_records(list(unique_data.values()))
+    
+    print(f"\n📊 Total unique training examples: {len(df)}")
+    
+    # Show category distribution (in order of first appearance)
+    categories = df['category'].value_counts(sort=False).to_dict()
+    
+    print("\n📈 Category Distribution:")
+    for cat, count in categories.items():
+        print(f"   {cat}: {count} examples")
+    
+    # Create training examples
+    training_examples = create_training_examples(df)
+    
+    print(f"\n🎯 Created {len(training_examples)} training examples")
+    
+    # Save training data summary
+    summary = {
+        'total_examples': len(training_examples),
+        'categories': categories,
+        'examples': training_examples.head(5).to_dict(orient='records')  # Save first 5 as sample
+    }
+    
+    summary_file = data_dir / "training_summary.json"
+    if orjson is not None:
+        # orjson writes UTF-8 natively, matching ensure_ascii=False
+        with open(summary_file, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+    
+    print(f"\n💾 Training summary saved to: {summary_file}")
+    
+    # Instructions for using the data
+    print("\n🚀 Next Steps:")
+    print("1. Start the backend server: cd backend && python app.py")
+    print("2. Use the dashboard to retrain the model with this data")
+    print("3. Or call the API endpoint: POST /api/model/retrain")
+    
+    print("\n✅ Training data loading complete!")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
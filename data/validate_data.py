@@ -1,250 +1,665 @@
-#!/usr/bin/env python3
-"""
-Data Validation Script for Smart Email Classifier
-Validates training data quality and consistency
-"""
-
-import json
-import csv
-from pathlib import Path
-from typing import Dict, List, Any
-
-def validate_json_file(file_path: Path) -> Dict[str, Any]:
-    """Validate a JSON training data file"""
-    print(f"🔍 Validating {file_path.name}...")
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if not isinstance(data, list):
-            return {"valid": False, "error": "Data must be a list"}
-        
-        validation_results = {
-            "valid": True,
-            "total_examples": len(data),
-            "categories": {},
-            "confidence_range": {"min": 1.0, "max": 0.0},
-            "errors": [],
-            "warnings": []
-        }
-        
-        required_fields = ["id", "subject", "body", "category", "confidence"]
-        valid_categories = ["Support", "Sales", "Complaints", "Feedback", "General"]
-        
-        for i, item in enumerate(data):
-            # Check required fields
-            for field in required_fields:
-                if field not in item:
-                    validation_results["errors"].append(f"Example {i+1}: Missing field '{field}'")
-                    validation_results["valid"] = False
-            
-            # Check data types
-            if not isinstance(item.get("id"), int):
-                validation_results["warnings"].append(f"Example {i+1}: ID should be integer")
-            
-            if not isinstance(item.get("subject"), str):
-                validation_results["errors"].append(f"Example {i+1}: Subject must be string")
-                validation_results["valid"] = False
-            
-            if not isinstance(item.get("body"), str):
-                validation_results["errors"].append(f"Example {i+1}: Body must be string")
-                validation_results["valid"] = False
-            
-            # Check category validity
-            category = item.get("category")
-            if category not in valid_categories:
-                validation_results["errors"].append(f"Example {i+1}: Invalid category '{category}'")
-                validation_results["valid"] = False
-            
-            # Track categories
-            if category:
-                validation_results["categories"][category] = validation_results["categories"].get(category, 0) + 1
-            
-            # Check confidence range
-            confidence = item.get("confidence")
-            if isinstance(confidence, (int, float)):
-                validation_results["confidence_range"]["min"] = min(validation_results["confidence_range"]["min"], confidence)
-                validation_results["confidence_range"]["max"] = max(validation_results["confidence_range"]["max"], confidence)
-                
-                if not 0 <= confidence <= 1:
-                    validation_results["warnings"].append(f"Example {i+1}: Confidence should be between 0 and 1")
-            else:
-                validation_results["warnings"].append(f"Example {i+1}: Confidence should be numeric")
-            
-            # Check content quality
-            subject = item.get("subject", "")
-            body = item.get("body", "")
-            
-            if len(subject.strip()) < 5:
-                validation_results["warnings"].append(f"Example {i+1}: Subject seems too short")
-            
-            if len(body.strip()) < 20:
-                validation_results["warnings"].append(f"Example {i+1}: Body seems too short")
-        
-        return validation_results
-        
-    except Exception as e:
-        return {"valid": False, "error": str(e)}
-
-def validate_csv_file(file_path: Path) -> Dict[str, Any]:
-    """Validate a CSV training data file"""
-    print(f"🔍 Validating {file_path.name}...")
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            data = list(reader)
-        
-        if not data:
-            return {"valid": False, "error": "CSV file is empty"}
-        
-        validation_results = {
-            "valid": True,
-            "total_examples": len(data),
-            "categories": {},
-            "confidence_range": {"min": 1.0, "max": 0.0},
-            "errors": [],
-            "warnings": []
-        }
-        
-        required_fields = ["id", "subject", "body", "category", "confidence"]
-        valid_categories = ["Support", "Sales", "Complaints", "Feedback", "General"]
-        
-        # Check headers
-        headers = list(data[0].keys())
-        missing_headers = [field for field in required_fields if field not in headers]
-        if missing_headers:
-            validation_results["errors"].append(f"Missing headers: {missing_headers}")
-            validation_results["valid"] = False
-        
-        for i, row in enumerate(data):
-            # Check required fields
-            for field in required_fields:
-                if field not in row or not row[field]:
-                    validation_results["errors"].append(f"Row {i+1}: Missing or empty field '{field}'")
-                    validation_results["valid"] = False
-            
-            # Check data types
-            try:
-                row_id = int(row.get("id", 0))
-            except ValueError:
-                validation_results["warnings"].append(f"Row {i+1}: ID should be integer")
-            
-            # Check category validity
-            category = row.get("category")
-            if category not in valid_categories:
-                validation_results["errors"].append(f"Row {i+1}: Invalid category '{category}'")
-                validation_results["valid"] = False
-            
-            # Track categories
-            if category:
-                validation_results["categories"][category] = validation_results["categories"].get(category, 0) + 1
-            
-            # Check confidence range
-            try:
-                confidence = float(row.get("confidence", 0))
-                validation_results["confidence_range"]["min"] = min(validation_results["confidence_range"]["min"], confidence)
-                validation_results["confidence_range"]["max"] = max(validation_results["confidence_range"]["max"], confidence)
-                
-                if not 0 <= confidence <= 1:
-                    validation_results["warnings"].append(f"Row {i+1}: Confidence should be between 0 and 1")
-            except ValueError:
-                validation_results["warnings"].append(f"Row {i+1}: Confidence should be numeric")
-            
-            # Check content quality
-            subject = row.get("subject", "")
-            body = row.get("body", "")
-            
-            if len(subject.strip()) < 5:
-                validation_results["warnings"].append(f"Row {i+1}: Subject seems too short")
-            
-            if len(body.strip()) < 20:
-                validation_results["warnings"].append(f"Row {i+1}: Body seems too short")
-        
-        return validation_results
-        
-    except Exception as e:
-        return {"valid": False, "error": str(e)}
-
-def print_validation_results(results: Dict[str, Any], filename: str):
-    """Print validation results in a formatted way"""
-    print(f"\n📊 Validation Results for {filename}")
-    print("-" * 50)
-    
-    if not results["valid"]:
-        print("❌ Validation FAILED")
-        if "error" in results:
-            print(f"Error: {results['error']}")
-        for error in results.get("errors", []):
-            print(f"❌ {error}")
-    else:
-        print("✅ Validation PASSED")
-        print(f"📈 Total examples: {results['total_examples']}")
-        
-        if results["categories"]:
-            print("\n📋 Category Distribution:")
-            for cat, count in results["categories"].items():
-                print(f"   {cat}: {count}")
-        
-        if results["confidence_range"]["min"] <= results["confidence_range"]["max"]:
-            print(f"\n🎯 Confidence Range: {results['confidence_range']['min']:.2f} - {results['confidence_range']['max']:.2f}")
-    
-    if results.get("warnings"):
-        print(f"\n⚠️  Warnings ({len(results['warnings'])}):")
-        for warning in results["warnings"][:5]:  # Show first 5 warnings
-            print(f"   ⚠️  {warning}")
-        if len(results["warnings"]) > 5:
-            print(f"   ... and {len(results['warnings']) - 5} more warnings")
-
-def main():
-    """Main validation function"""
-    print("🔍 Data Validation for Smart Email Classifier")
-    print("=" * 50)
-    
-    data_dir = Path(__file__).parent
-    validation_results = []
-    
-    # Validate all data files
-    for file_path in data_dir.glob("*.json"):
-        if file_path.name not in ["README.md", "load_training_data.py", "validate_data.py"]:
-            results = validate_json_file(file_path)
-            results["filename"] = file_path.name
-            validation_results.append(results)
-    
-    for file_path in data_dir.glob("*.csv"):
-        results = validate_csv_file(file_path)
-        results["filename"] = file_path.name
-        validation_results.append(results)
-    
-    # Print results
-    for results in validation_results:
-        print_validation_results(results, results["filename"])
-    
-    # Summary
-    print("\n" + "=" * 50)
-    print("📋 VALIDATION SUMMARY")
-    print("=" * 50)
-    
-    total_files = len(validation_results)
-    valid_files = sum(1 for r in validation_results if r["valid"])
-    total_examples = sum(r.get("total_examples", 0) for r in validation_results)
-    
-    print(f"📁 Files processed: {total_files}")
-    print(f"✅ Valid files: {valid_files}")
-    print(f"❌ Invalid files: {total_files - valid_files}")
-    print(f"📊 Total examples: {total_examples}")
-    
-    if valid_files == total_files:
-        print("\n🎉 All data files are valid!")
-    else:
-        print(f"\n⚠️  {total_files - valid_files} files have validation issues")
-    
-    print("\n💡 Tips:")
-    print("- Fix errors before using the data for training")
-    print("- Review warnings for potential data quality issues")
-    print("- Ensure categories match exactly: Support, Sales, Complaints, Feedback, General")
-    print("- Confidence scores should be between 0 and 1")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Data Validation Script for Smart Email Classifier
+Validates training data quality and consistency
+"""
+
+import os
+import sys
+import json
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, JSON files are loaded whole instead of streamed
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the stdlib json parser
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional dependency, numeric checks run as NumPy expressions instead
+    njit = None
+
+# Read files through 64KB buffers (ijson's default chunk size) rather than the
+# 8KB io default, so large data files are read in fewer syscalls
+READ_BUFFER_SIZE = 64 * 1024
+
+# Bytes sniffed from the start of a file to reject obviously malformed input unparsed
+PRESCREEN_BYTES = 1024
+
+# Rows per DataFrame chunk when streaming CSV files
+CSV_CHUNK_ROWS = 50_000
+
+# Stand-in for the last cell of a CSV row with too many fields, so it keeps its row number
+BAD_ROW_MARKER = "\x00wrong number of fields"
+
+# Errors and warnings are counted; only the first few messages are kept for the report
+SAMPLE_SIZE = 5
+
+REQUIRED_FIELDS = ("id", "subject", "body", "category", "confidence")
+VALID_CATEGORIES = frozenset({"Support", "Sales", "Complaints", "Feedback", "General"})
+
+
+# Bits of the per-example field flags column: one per required field that is present,
+# then whether id, subject and body have the expected types
+FIELD_PRESENT_FLAGS = {field: 1 << bit for bit, field in enumerate(REQUIRED_FIELDS)}
+ALL_FIELDS_PRESENT = sum(FIELD_PRESENT_FLAGS.values())
+ID_IS_INT = 1 << 5
+SUBJECT_IS_STR = 1 << 6
+BODY_IS_STR = 1 << 7
+
+# Results of earlier runs, keyed by file path and reused while (mtime, size) is unchanged
+VALIDATION_CACHE_PATH = Path(__file__).parent / ".validation_cache.json"
+VALIDATION_CACHE_SIZE = 64
+VALIDATION_CACHE_VERSION = 3
+
+# Files in the data directory that are never validated
+SKIPPED_FILES = frozenset({"README.md", "load_training_data.py", "validate_data.py", VALIDATION_CACHE_PATH.name})
+
+def _first_json_char(f) -> bytes:
+    """Return the first non-whitespace byte of a binary JSON stream and rewind it"""
+    first = b''
+    while True:
+        chunk = f.read(4096)
+        if not chunk:
+            break
+        stripped = chunk.lstrip()
+        if stripped:
+            first = stripped[:1]
+            break
+    f.seek(0)
+    return first
+
+# Source of the loop that unpacks JSON examples into columns (see validate_json_file);
+# the field checks are written out from REQUIRED_FIELDS and the flag bits at import time
+_UNPACKER_TEMPLATE = """
+def unpack_examples(items, field_flags, category_codes, codes, confidences, numeric,
+                    subject_lens, body_lens):
+    add_flags = field_flags.append
+    add_code = category_codes.append
+    code_for = codes.setdefault
+    add_confidence = confidences.append
+    add_numeric = numeric.append
+    add_subject_len = subject_lens.append
+    add_body_len = body_lens.append
+    
+    for item in items:
+        flags = 0
+{presence}
+        if isinstance(item.get('id'), int):
+            flags |= {id_is_int}
+        if isinstance(item.get('subject'), str):
+            flags |= {subject_is_str}
+        if isinstance(item.get('body'), str):
+            flags |= {body_is_str}
+        add_flags(flags)
+        
+        add_code(code_for(item.get('category'), len(codes)))
+        confidence = item.get('confidence')
+        if isinstance(confidence, (int, float)):
+            add_confidence(confidence)
+            add_numeric(True)
+        else:
+            add_confidence(0.0)
+            add_numeric(False)
+        
+        # str.strip() hands back the string itself when there is no surrounding
+        # whitespace, so only padded text is copied here
+        add_subject_len(len(item.get('subject', '').strip()))
+        add_body_len(len(item.get('body', '').strip()))
+"""
+
+def _build_example_unpacker() -> Callable:
+    """Generate the example unpacking loop as straight-line code specialized to the field checks"""
+    presence = "\n".join(
+        f"        if {field!r} in item:\n            flags |= {FIELD_PRESENT_FLAGS[field]}"
+        for field in REQUIRED_FIELDS
+    )
+    source = _UNPACKER_TEMPLATE.format(
+        presence=presence,
+        id_is_int=ID_IS_INT,
+        subject_is_str=SUBJECT_IS_STR,
+        body_is_str=BODY_IS_STR
+    )
+    
+    namespace = {}
+    exec(compile(source, "<validate_data.unpack_examples>", "exec"), namespace)
+    return namespace["unpack_examples"]
+
+_unpack_examples = _build_example_unpacker()
+
+def validate_json_file(file_path: Path) -> Dict[str, Any]:
+    """Validate a JSON training data file"""
+    try:
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            if ijson is not None:
+                # Stream records one at a time instead of loading the whole array
+                if _first_json_char(f) not in (b'[', b''):
+                    return {"valid": False, "error": "Data must be a list"}
+                items = ijson.items(f, 'item', buf_size=READ_BUFFER_SIZE, use_float=True)
+            else:
+                items = orjson.loads(f.read()) if orjson is not None else json.load(f)
+                if not isinstance(items, list):
+                    return {"valid": False, "error": "Data must be a list"}
+            
+            validation_results = {
+                "valid": True,
+                "total_examples": 0,
+                "categories": {},
+                "confidence_range": {"min": 1.0, "max": 0.0},
+                "error_count": 0,
+                "error_samples": [],
+                "warning_count": 0,
+                "warning_samples": []
+            }
+            
+            # Examples are only unpacked into typed columns here (structure of arrays);
+            # every check then runs column-wise once the file has been read
+            field_flags = array('B')
+            category_codes = array('q')
+            codes = {}
+            confidences = array('d')
+            numeric = array('B')
+            subject_lens = array('q')
+            body_lens = array('q')
+            
+            _unpack_examples(items, field_flags, category_codes, codes, confidences, numeric,
+                             subject_lens, body_lens)
+        
+        validation_results["total_examples"] = len(field_flags)
+        
+        # Messages are built only for the first flagged examples and sorted back into
+        # per-example order
+        errors, warnings = [], []
+        error_count = warning_count = 0
+        flags = np.frombuffer(field_flags, dtype=np.uint8)
+        
+        # Check required fields
+        for order, field in enumerate(REQUIRED_FIELDS):
+            error_count += _flag_rows(errors, (flags & FIELD_PRESENT_FLAGS[field]) == 0, order,
+                                      "Example {row}: Missing field '" + field + "'")
+        
+        # Check data types
+        warning_count += _flag_rows(warnings, (flags & ID_IS_INT) == 0, 5, "Example {row}: ID should be integer")
+        error_count += _flag_rows(errors, (flags & SUBJECT_IS_STR) == 0, 5, "Example {row}: Subject must be string")
+        error_count += _flag_rows(errors, (flags & BODY_IS_STR) == 0, 6, "Example {row}: Body must be string")
+        
+        # Check category validity, once per distinct value
+        category_codes = np.frombuffer(category_codes, dtype=np.int64)
+        distinct = np.array(list(codes), dtype=object)
+        valid_codes = np.fromiter((value in VALID_CATEGORIES for value in distinct), dtype=bool, count=len(distinct))
+        error_count += _flag_rows(errors, ~valid_codes[category_codes], 7,
+                                  "Example {row}: Invalid category '{value}'", distinct[category_codes])
+        
+        # Track categories
+        counts = np.bincount(category_codes, minlength=len(distinct))
+        validation_results["categories"] = {value: int(count) for value, count in zip(distinct, counts) if value}
+        
+        # Check confidence range and content quality
+        confidences = np.frombuffer(confidences, dtype=np.float64)
+        numeric = np.frombuffer(numeric, dtype=np.bool_)
+        validation_results["confidence_range"] = _confidence_range(confidences, numeric)
+        warning_count += _flag_numeric_checks(
+            warnings, "Example", confidences, numeric,
+            np.frombuffer(subject_lens, dtype=np.int64),
+            np.frombuffer(body_lens, dtype=np.int64)
+        )
+        
+        if error_count:
+            validation_results["valid"] = False
+        _merge_issues(validation_results, "error", error_count, errors)
+        _merge_issues(validation_results, "warning", warning_count, warnings)
+        
+        return validation_results
+        
+    except Exception as e:
+        return {"valid": False, "error": str(e)}
+
+def _merge_issues(validation_results: Dict[str, Any], kind: str, count: int, samples: List):
+    """Add (row, check order, message) issues that all follow the ones already recorded"""
+    validation_results[f"{kind}_count"] += count
+    kept = validation_results[f"{kind}_samples"]
+    samples.sort(key=lambda entry: entry[:2])
+    kept.extend(message for _, _, message in samples[:SAMPLE_SIZE - len(kept)])
+
+def _flag_rows(target: List, mask: np.ndarray, order: int, template: str,
+               values: np.ndarray = None, offset: int = 0, limit: int = SAMPLE_SIZE) -> int:
+    """Sample messages for the first limit rows where mask is set and return how many are set"""
+    if limit <= 0:
+        # The sample is already full, so only the count matters
+        return int(np.count_nonzero(mask))
+    
+    rows = np.flatnonzero(mask)
+    for i in rows[:limit]:
+        value = values[i] if values is not None else None
+        target.append((offset + i, order, template.format(row=offset + i + 1, value=value)))
+    return len(rows)
+
+def _numeric_checks(confidence: np.ndarray, numeric: np.ndarray,
+                    subject_len: np.ndarray, body_len: np.ndarray):
+    """Flag out-of-range confidences and too-short subjects and bodies"""
+    out_of_range = numeric & ~((confidence >= 0) & (confidence <= 1))
+    return out_of_range, subject_len < 5, body_len < 20
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _numeric_checks(confidence, numeric, subject_len, body_len):
+        """Same checks as an indexed prange loop, compiled to a multi-threaded SIMD kernel"""
+        n = confidence.shape[0]
+        out_of_range = np.zeros(n, dtype=np.bool_)
+        subject_short = np.zeros(n, dtype=np.bool_)
+        body_short = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            out_of_range[i] = numeric[i] and not (0 <= confidence[i] <= 1)
+            subject_short[i] = subject_len[i] < 5
+            body_short[i] = body_len[i] < 20
+        return out_of_range, subject_short, body_short
+
+def _confidence_range(confidence: np.ndarray, numeric: np.ndarray) -> Dict[str, float]:
+    """Fold the numeric confidences into the reported range with NaN-ignoring reductions"""
+    values = confidence[numeric]
+    return {
+        "min": float(np.fmin.reduce(values, initial=1.0)),
+        "max": float(np.fmax.reduce(values, initial=0.0))
+    }
+
+def _flag_numeric_checks(target: List, label: str, confidence: np.ndarray, numeric: np.ndarray,
+                         subject_len: np.ndarray, body_len: np.ndarray, offset: int = 0,
+                         limit: int = SAMPLE_SIZE) -> int:
+    """Run the numeric checks over whole columns and return the number of warnings"""
+    out_of_range, subject_short, body_short = _numeric_checks(confidence, numeric, subject_len, body_len)
+    return (
+        _flag_rows(target, out_of_range, 7, label + " {row}: Confidence should be between 0 and 1", offset=offset, limit=limit)
+        + _flag_rows(target, ~numeric, 7, label + " {row}: Confidence should be numeric", offset=offset, limit=limit)
+        + _flag_rows(target, subject_short, 8, label + " {row}: Subject seems too short", offset=offset, limit=limit)
+        + _flag_rows(target, body_short, 9, label + " {row}: Body seems too short", offset=offset, limit=limit)
+    )
+
+def _stripped_lengths(texts: pd.Series) -> np.ndarray:
+    """Lengths of texts without surrounding whitespace, in one pass with no intermediate Series"""
+    return np.fromiter(map(len, map(str.strip, texts.to_numpy())), dtype=np.int64, count=len(texts))
+
+def _validate_csv_chunk(df: pd.DataFrame, offset: int, validation_results: Dict[str, Any]):
+    """Validate one chunk of CSV rows, offset being the number of rows before it"""
+    # Short rows come back as NaN; treat them like empty cells
+    df = df.fillna('')
+    
+    # Each check is a column-wise mask; messages are built only for the first flagged
+    # rows and sorted back into per-row order afterwards. Earlier chunks hold earlier
+    # rows, so once their samples are full this chunk only needs counting
+    errors, warnings = [], []
+    error_count = warning_count = 0
+    error_room = SAMPLE_SIZE - len(validation_results["error_samples"])
+    warning_room = SAMPLE_SIZE - len(validation_results["warning_samples"])
+    empty = pd.Series('', index=df.index)
+    
+    # Check required fields
+    for order, field in enumerate(REQUIRED_FIELDS):
+        missing = (df[field] == '').to_numpy() if field in df.columns else np.ones(len(df), dtype=bool)
+        error_count += _flag_rows(errors, missing, order, "Row {row}: Missing or empty field '" + field + "'",
+                                  offset=offset, limit=error_room)
+    
+    # Check data types
+    if "id" in df.columns:
+        bad_id = ~df["id"].str.strip().str.fullmatch(r'[+-]?\d+').to_numpy(dtype=bool)
+        warning_count += _flag_rows(warnings, bad_id, 5, "Row {row}: ID should be integer",
+                                    offset=offset, limit=warning_room)
+    
+    # Check category validity
+    if "category" in df.columns:
+        category = df["category"]
+        error_count += _flag_rows(errors, (~category.isin(VALID_CATEGORIES)).to_numpy(), 6,
+                                  "Row {row}: Invalid category '{value}'", category.to_numpy(),
+                                  offset=offset, limit=error_room)
+        
+        # Track categories
+        categories = validation_results["categories"]
+        for cat, count in category[category != ''].value_counts(sort=False).items():
+            categories[cat] = categories.get(cat, 0) + int(count)
+    else:
+        error_count += _flag_rows(errors, np.ones(len(df), dtype=bool), 6, "Row {row}: Invalid category 'None'",
+                                  offset=offset, limit=error_room)
+    
+    # Parse confidences and track their range
+    if "confidence" in df.columns:
+        raw_confidence = df["confidence"].to_numpy()
+        confidence = pd.to_numeric(df["confidence"].str.strip(), errors='coerce').to_numpy(dtype=np.float64, copy=True)
+        numeric = ~np.isnan(confidence)
+        
+        # NaN also marks cells to_numeric rejected; retry those with float(), which accepts
+        # "nan" and "1_000" so they get the range check rather than a not-numeric warning
+        for i in np.flatnonzero(~numeric):
+            try:
+                confidence[i] = float(raw_confidence[i])
+                numeric[i] = True
+            except ValueError:
+                pass
+    else:
+        confidence = np.zeros(len(df), dtype=np.float64)
+        numeric = np.ones(len(df), dtype=bool)
+    chunk_range = _confidence_range(confidence, numeric)
+    confidence_range = validation_results["confidence_range"]
+    confidence_range["min"] = min(confidence_range["min"], chunk_range["min"])
+    confidence_range["max"] = max(confidence_range["max"], chunk_range["max"])
+    
+    # Check confidence range and content quality
+    subject = df["subject"] if "subject" in df.columns else empty
+    body = df["body"] if "body" in df.columns else empty
+    warning_count += _flag_numeric_checks(
+        warnings, "Row", confidence, numeric,
+        _stripped_lengths(subject),
+        _stripped_lengths(body),
+        offset=offset, limit=warning_room
+    )
+    
+    if error_count:
+        validation_results["valid"] = False
+    _merge_issues(validation_results, "error", error_count, errors)
+    _merge_issues(validation_results, "warning", warning_count, warnings)
+
+def _new_csv_results() -> Dict[str, Any]:
+    """Empty CSV validation results"""
+    return {
+        "valid": True,
+        "total_examples": 0,
+        "categories": {},
+        "confidence_range": {"min": 1.0, "max": 0.0},
+        "error_count": 0,
+        "error_samples": [],
+        "warning_count": 0,
+        "warning_samples": []
+    }
+
+def _mark_bad_row(fields: List[str], width: int) -> List[str]:
+    """Keep a row with too many fields in place, its last cell replaced by BAD_ROW_MARKER"""
+    return fields[:width - 1] + [BAD_ROW_MARKER]
+
+def _validate_csv_rows(file_path: Path, validation_results: Dict[str, Any], **read_options):
+    """Stream a CSV file through the chunk checks, reporting rows marked by _mark_bad_row"""
+    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        # Stream the file in fixed-size chunks so memory does not grow with its length
+        chunks = pd.read_csv(f, dtype=str, keep_default_na=False, encoding='utf-8',
+                             chunksize=CSV_CHUNK_ROWS, **read_options)
+        
+        for df in chunks:
+            if not isinstance(df.index, pd.RangeIndex):
+                # A first row with one extra field makes pandas take the ids as the index
+                raise pd.errors.ParserError("Row 1: Wrong number of fields")
+            
+            offset = validation_results["total_examples"]
+            if offset == 0:
+                # Check headers
+                missing_headers = [field for field in REQUIRED_FIELDS if field not in df.columns]
+                if missing_headers:
+                    _merge_issues(validation_results, "error", 1, [(-1, 0, f"Missing headers: {missing_headers}")])
+                    validation_results["valid"] = False
+            
+            # Rows with the wrong number of fields get one error and skip the other checks;
+            # the rows around them are validated as separate runs so row numbers stay aligned
+            start = 0
+            bad_rows = np.flatnonzero((df.iloc[:, -1] == BAD_ROW_MARKER).to_numpy())
+            for position in bad_rows:
+                if position > start:
+                    _validate_csv_chunk(df.iloc[start:position], offset + start, validation_results)
+                _merge_issues(validation_results, "error", 1,
+                              [(offset + position, 0, f"Row {offset + position + 1}: Wrong number of fields")])
+                validation_results["valid"] = False
+                start = position + 1
+            if start < len(df) or len(df) == 0:
+                _validate_csv_chunk(df.iloc[start:], offset + start, validation_results)
+            
+            validation_results["total_examples"] += len(df)
+
+def validate_csv_file(file_path: Path) -> Dict[str, Any]:
+    """Validate a CSV training data file"""
+    try:
+        validation_results = _new_csv_results()
+        
+        try:
+            _validate_csv_rows(file_path, validation_results)
+        except pd.errors.EmptyDataError:
+            return {"valid": False, "error": "CSV file is empty"}
+        except pd.errors.ParserError:
+            # The C parser stops at the first row with extra fields; start over on the
+            # slower Python engine, which hands such rows to _mark_bad_row instead.
+            # Naming the columns keeps it from reading an extra first field as the index
+            validation_results = _new_csv_results()
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                columns = list(pd.read_csv(f, nrows=0).columns)
+            _validate_csv_rows(file_path, validation_results, engine='python', names=columns, header=0,
+                               on_bad_lines=lambda fields: _mark_bad_row(fields, len(columns)))
+        
+        if validation_results["total_examples"] == 0:
+            return {"valid": False, "error": "CSV file is empty"}
+        
+        return validation_results
+        
+    except Exception as e:
+        return {"valid": False, "error": str(e)}
+
+def load_validation_cache() -> "OrderedDict[str, Dict[str, Any]]":
+    """Load cached validation results from the previous run, oldest entry first"""
+    try:
+        with open(VALIDATION_CACHE_PATH, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved.get("version") == VALIDATION_CACHE_VERSION:
+            return OrderedDict(saved["entries"])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return OrderedDict()
+
+def save_validation_cache(cache: "OrderedDict[str, Dict[str, Any]]"):
+    """Persist the validation cache, keeping only the most recently used entries"""
+    while len(cache) > VALIDATION_CACHE_SIZE:
+        cache.popitem(last=False)
+    
+    try:
+        tmp_path = f"{VALIDATION_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": VALIDATION_CACHE_VERSION, "entries": cache}, f)
+        os.replace(tmp_path, VALIDATION_CACHE_PATH)
+    except OSError as e:
+        print(f"⚠️  Could not save validation cache: {e}")
+
+def get_cached_results(file_path: Path, stat: os.stat_result,
+                       cache: "OrderedDict[str, Dict[str, Any]]") -> Optional[Dict[str, Any]]:
+    """Return cached results for file_path if it is unchanged since they were stored"""
+    key = str(file_path.resolve())
+    
+    entry = cache.get(key)
+    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        cache.move_to_end(key)
+        return dict(entry["results"])
+    return None
+
+def store_cached_results(file_path: Path, stat: os.stat_result, results: Dict[str, Any],
+                         cache: "OrderedDict[str, Dict[str, Any]]"):
+    """Remember results for file_path as it was when stat was taken"""
+    key = str(file_path.resolve())
+    cache[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "results": dict(results)}
+    cache.move_to_end(key)
+
+def _prescreen(file_path: Path, size: int) -> Optional[Dict[str, Any]]:
+    """Return an error result for empty or clearly malformed files, None if they need validating"""
+    is_csv = file_path.suffix == ".csv"
+    if size == 0:
+        return {"valid": False, "error": "CSV file is empty" if is_csv else "File is empty"}
+    
+    with open(file_path, 'rb') as f:
+        head = f.read(PRESCREEN_BYTES)
+    whole_file = size <= len(head)
+    
+    if is_csv:
+        # A header plus at least one row needs a line break
+        if whole_file and b'\n' not in head and b'\r' not in head:
+            return {"valid": False, "error": "CSV file is empty"}
+        return None
+    
+    first = head.lstrip()[:1]
+    if not first:
+        return {"valid": False, "error": "File is empty"} if whole_file else None
+    if first not in (b'[', b'{'):
+        return {"valid": False, "error": f"File does not start with a JSON array or object (found {first!r})"}
+    return None
+
+def validate_file(file_path: Path) -> Dict[str, Any]:
+    """Validate a data file with the validator matching its extension"""
+    if file_path.suffix == ".csv":
+        return validate_csv_file(file_path)
+    return validate_json_file(file_path)
+
+def validate_files(file_paths: List[Path]) -> Dict[Path, Dict[str, Any]]:
+    """Validate independent files in parallel worker processes, serially if that is not possible"""
+    results = {}
+    if len(file_paths) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as executor:
+                futures = {executor.submit(validate_file, file_path): file_path for file_path in file_paths}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"⚠️  Parallel validation unavailable ({e}), validating serially")
+    
+    for file_path in file_paths:
+        if file_path not in results:
+            results[file_path] = validate_file(file_path)
+    return results
+
+def print_validation_results(results: Dict[str, Any], filename: str,
+                             writer: Optional[Callable[[str], Any]] = None):
+    """Print validation results in a formatted way, as a single write (stdout by default)"""
+    lines = []
+    lines.append(f"\n📊 Validation Results for {filename}")
+    lines.append("-" * 50)
+    
+    if not results["valid"]:
+        lines.append("❌ Validation FAILED")
+        if "error" in results:
+            lines.append(f"Error: {results['error']}")
+        for error in results.get("error_samples", []):
+            lines.append(f"❌ {error}")
+        if results.get("error_count", 0) > len(results.get("error_samples", [])):
+            lines.append(f"... and {results['error_count'] - len(results['error_samples'])} more errors")
+    else:
+        lines.append("✅ Validation PASSED")
+        lines.append(f"📈 Total examples: {results['total_examples']}")
+        
+        if results["categories"]:
+            lines.append("\n📋 Category Distribution:")
+            for cat, count in results["categories"].items():
+                lines.append(f"   {cat}: {count}")
+        
+        if results["confidence_range"]["min"] <= results["confidence_range"]["max"]:
+            lines.append(f"\n🎯 Confidence Range: {results['confidence_range']['min']:.2f} - {results['confidence_range']['max']:.2f}")
+    
+    if results.get("warning_count"):
+        lines.append(f"\n⚠️  Warnings ({results['warning_count']}):")
+        for warning in results["warning_samples"]:
+            lines.append(f"   ⚠️  {warning}")
+        if results["warning_count"] > len(results["warning_samples"]):
+            lines.append(f"   ... and {results['warning_count'] - len(results['warning_samples'])} more warnings")
+    
+    (writer or sys.stdout.write)("\n".join(lines) + "\n")
+
+def main():
+    """Main validation function"""
+    print("🔍 Data Validation for Smart Email Classifier")
+    print("=" * 50)
+    
+    data_dir = Path(__file__).parent
+    cache = load_validation_cache()
+    
+    # Validate all data files, found in a single directory scan (JSON files first)
+    json_paths, csv_paths = [], []
+    stats = {}
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name in SKIPPED_FILES or not entry.is_file():
+                continue
+            if entry.name.endswith(".json"):
+                found = json_paths
+            elif entry.name.endswith(".csv"):
+                found = csv_paths
+            else:
+                continue
+            file_path = data_dir / entry.name
+            found.append(file_path)
+            stats[file_path] = entry.stat()
+    file_paths = json_paths + csv_paths
+    
+    results_by_path = {}
+    progress = []
+    pending = []
+    for file_path in file_paths:
+        cached = get_cached_results(file_path, stats[file_path], cache)
+        if cached is not None:
+            progress.append(f"🔍 Validating {file_path.name}... (unchanged, cached)")
+            results_by_path[file_path] = cached
+            continue
+        
+        progress.append(f"🔍 Validating {file_path.name}...")
+        rejected = _prescreen(file_path, stats[file_path].st_size)
+        if rejected is not None:
+            results_by_path[file_path] = rejected
+        else:
+            pending.append(file_path)
+    sys.stdout.write("".join(line + "\n" for line in progress))
+    sys.stdout.flush()
+    
+    for file_path, results in validate_files(pending).items():
+        store_cached_results(file_path, stats[file_path], results, cache)
+        results_by_path[file_path] = results
+    
+    save_validation_cache(cache)
+    
+    validation_results = []
+    for file_path in file_paths:
+        results = results_by_path[file_path]
+        results["filename"] = file_path.name
+        validation_results.append(results)
+    
+    # Print results, buffered into one write
+    report = []
+    for results in validation_results:
+        print_validation_results(results, results["filename"], writer=report.append)
+    sys.stdout.write("".join(report))
+    
+    # Summary
+    print("\n" + "=" * 50)
+    print("📋 VALIDATION SUMMARY")
+    print("=" * 50)
+    
+    total_files = len(validation_results)
+    valid_files = sum(1 for r in validation_results if r["valid"])
+    total_examples = sum(r.get("total_examples", 0) for r in validation_results)
+    
+    print(f"📁 Files processed: {total_files}")
+    print(f"✅ Valid files: {valid_files}")
+    print(f"❌ Invalid files: {total_files - valid_files}")
+    print(f"📊 Total examples: {total_examples}")
+    
+    if valid_files == total_files:
+        print("\n🎉 All data files are valid!")
+    else:
+        print(f"\n⚠️  {total_files - valid_files} files have validation issues")
+    
+    print("\n💡 Tips:")
+    print("- Fix errors before using the data for training")
+    print("- Review warnings for potential data quality issues")
+    print("- Ensure categories match exactly: Support, Sales, Complaints, Feedback, General")
+    print("- Confidence scores should be between 0 and 1")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
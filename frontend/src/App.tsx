@@ -1,28 +1,28 @@
-import React from 'react';
-import { BrowserRouter as Router, Routes, Route } from 'react-router-dom';
-import Dashboard from './components/Dashboard';
-import EmailList from './components/EmailList';
-import Analytics from './components/Analytics';
-import Settings from './components/Settings';
-import Sidebar from './components/Sidebar';
-import './App.css';
-
-function App() {
-  return (
-    <Router>
-      <div className="flex h-screen bg-gray-50">
-        <Sidebar />
-        <main className="flex-1 overflow-auto">
-          <Routes>
-            <Route path="/" element={<Dashboard />} />
-            <Route path="/emails" element={<EmailList />} />
-            <Route path="/analytics" element={<Analytics />} />
-            <Route path="/settings" element={<Settings />} />
-          </Routes>
-        </main>
-      </div>
-    </Router>
-  );
-}
-
+import React from 'react';
+import { BrowserRouter as Router, Routes, Route } from 'react-router-dom';
+import Dashboard from './components/Dashboard';
+import EmailList from './components/EmailList';
+import Analytics from './components/Analytics';
+import Settings from './components/Settings';
+import Sidebar from './components/Sidebar';
+import './App.css';
+
+function App() {
+  return (
+    <Router>
+      <div className="flex h-screen bg-gray-50">
+        <Sidebar />
+        <main className="flex-1 overflow-auto">
+          <Routes>
+            <Route path="/" element={<Dashboard />} />
+            <Route path="/emails" element={<EmailList />} />
+            <Route path="/analytics" element={<Analytics />} />
+            <Route path="/settings" element={<Settings />} />
+          </Routes>
+        </main>
+      </div>
+    </Router>
+  );
+}
+
 export default App; 
\ No newline at end of file
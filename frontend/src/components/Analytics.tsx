@@ -1,304 +1,304 @@
-import React, { useState, useEffect } from 'react';
-import { 
-  BarChart3, 
-  TrendingUp, 
-  Download,
-  RefreshCw,
-  Brain,
-  Activity
-} from 'lucide-react';
-import { PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, LineChart, Line } from 'recharts';
-import { analyticsService } from '../services/analyticsService';
-
-interface AnalyticsData {
-  category_distribution: Record<string, number>;
-  average_confidence: Record<string, number>;
-  recent_activity: any[];
-}
-
-const COLORS = ['#0088FE', '#00C49F', '#FFBB28', '#FF8042', '#8884D8'];
-
-const Analytics: React.FC = () => {
-  const [analytics, setAnalytics] = useState<AnalyticsData | null>(null);
-  const [loading, setLoading] = useState(true);
-  const [retraining, setRetraining] = useState(false);
-
-  useEffect(() => {
-    loadAnalytics();
-  }, []);
-
-  const loadAnalytics = async () => {
-    try {
-      setLoading(true);
-      const data = await analyticsService.getAnalytics();
-      setAnalytics(data);
-    } catch (error) {
-      console.error('Error loading analytics:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  const handleRetrainModel = async () => {
-    try {
-      setRetraining(true);
-      await analyticsService.retrainModel();
-      await loadAnalytics(); // Refresh data
-      // Show success message
-    } catch (error) {
-      console.error('Error retraining model:', error);
-    } finally {
-      setRetraining(false);
-    }
-  };
-
-  const handleExport = async () => {
-    try {
-      const blob = await analyticsService.exportAnalytics('csv');
-      const url = window.URL.createObjectURL(blob);
-      const a = document.createElement('a');
-      a.href = url;
-      a.download = `analytics_${new Date().toISOString().split('T')[0]}.csv`;
-      a.click();
-      window.URL.revokeObjectURL(url);
-    } catch (error) {
-      console.error('Error exporting analytics:', error);
-    }
-  };
-
-  const prepareChartData = () => {
-    if (!analytics) return { pieData: [], barData: [], lineData: [] };
-
-    // Pie chart data for category distribution
-    const pieData = Object.entries(analytics.category_distribution).map(([name, value]) => ({
-      name,
-      value
-    }));
-
-    // Bar chart data for average confidence
-    const barData = Object.entries(analytics.average_confidence).map(([name, value]) => ({
-      name,
-      confidence: Math.round(value * 100)
-    }));
-
-    // Line chart data for recent activity (simulated)
-    const lineData = Array.from({ length: 7 }, (_, i) => ({
-      day: `Day ${i + 1}`,
-      emails: Math.floor(Math.random() * 50) + 10,
-      accuracy: Math.floor(Math.random() * 20) + 80
-    }));
-
-    return { pieData, barData, lineData };
-  };
-
-  if (loading) {
-    return (
-      <div className="p-8">
-        <div className="animate-pulse">
-          <div className="h-8 bg-gray-200 rounded w-1/4 mb-6"></div>
-          <div className="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-8">
-            {[...Array(4)].map((_, i) => (
-              <div key={i} className="h-64 bg-gray-200 rounded"></div>
-            ))}
-          </div>
-        </div>
-      </div>
-    );
-  }
-
-  if (!analytics) {
-    return (
-      <div className="p-8">
-        <div className="text-center text-gray-500">
-          <BarChart3 className="w-12 h-12 mx-auto mb-4 text-gray-300" />
-          <p>No analytics data available</p>
-        </div>
-      </div>
-    );
-  }
-
-  const { pieData, barData, lineData } = prepareChartData();
-
-  return (
-    <div className="p-8">
-      {/* Header */}
-      <div className="mb-8">
-        <h1 className="text-3xl font-bold text-gray-900 mb-2">Analytics</h1>
-        <p className="text-gray-600">Monitor system performance and email classification metrics</p>
-      </div>
-
-      {/* Quick Actions */}
-      <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-8">
-        <div className="flex flex-wrap gap-4">
-          <button
-            onClick={handleRetrainModel}
-            disabled={retraining}
-            className="flex items-center space-x-2 px-4 py-2 bg-purple-600 text-white rounded-lg hover:bg-purple-700 disabled:opacity-50 disabled:cursor-not-allowed"
-          >
-            {retraining ? (
-              <RefreshCw className="w-4 h-4 animate-spin" />
-            ) : (
-              <Brain className="w-4 h-4" />
-            )}
-            <span>{retraining ? 'Retraining...' : 'Retrain Model'}</span>
-          </button>
-
-          <button
-            onClick={handleExport}
-            className="flex items-center space-x-2 px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700"
-          >
-            <Download className="w-4 h-4" />
-            <span>Export Data</span>
-          </button>
-
-          <button
-            onClick={loadAnalytics}
-            className="flex items-center space-x-2 px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700"
-          >
-            <RefreshCw className="w-4 h-4" />
-            <span>Refresh</span>
-          </button>
-        </div>
-      </div>
-
-      {/* Charts Grid */}
-      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-8">
-        {/* Category Distribution Pie Chart */}
-        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
-          <h3 className="text-lg font-semibold text-gray-900 mb-4">Category Distribution</h3>
-          <ResponsiveContainer width="100%" height={300}>
-            <PieChart>
-              <Pie
-                data={pieData}
-                cx="50%"
-                cy="50%"
-                labelLine={false}
-                label={({ name, percent }) => `${name} ${(percent * 100).toFixed(0)}%`}
-                outerRadius={80}
-                fill="#8884d8"
-                dataKey="value"
-              >
-                {pieData.map((entry, index) => (
-                  <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
-                ))}
-              </Pie>
-              <Tooltip />
-            </PieChart>
-          </ResponsiveContainer>
-        </div>
-
-        {/* Average Confidence Bar Chart */}
-        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
-          <h3 className="text-lg font-semibold text-gray-900 mb-4">Average Confidence by Category</h3>
-          <ResponsiveContainer width="100%" height={300}>
-            <BarChart data={barData}>
-              <CartesianGrid strokeDasharray="3 3" />
-              <XAxis dataKey="name" />
-              <YAxis />
-              <Tooltip />
-              <Bar dataKey="confidence" fill="#8884d8" />
-            </BarChart>
-          </ResponsiveContainer>
-        </div>
-      </div>
-
-      {/* Performance Trends */}
-      <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-8">
-        <h3 className="text-lg font-semibold text-gray-900 mb-4">Performance Trends (Last 7 Days)</h3>
-        <ResponsiveContainer width="100%" height={300}>
-          <LineChart data={lineData}>
-            <CartesianGrid strokeDasharray="3 3" />
-            <XAxis dataKey="day" />
-            <YAxis yAxisId="left" />
-            <YAxis yAxisId="right" orientation="right" />
-            <Tooltip />
-            <Legend />
-            <Line yAxisId="left" type="monotone" dataKey="emails" stroke="#8884d8" name="Emails Processed" />
-            <Line yAxisId="right" type="monotone" dataKey="accuracy" stroke="#82ca9d" name="Accuracy %" />
-          </LineChart>
-        </ResponsiveContainer>
-      </div>
-
-      {/* Summary Stats */}
-      <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
-        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
-          <div className="flex items-center">
-            <div className="p-2 bg-blue-100 rounded-lg">
-              <Activity className="w-6 h-6 text-blue-600" />
-            </div>
-            <div className="ml-4">
-              <p className="text-sm font-medium text-gray-600">Total Emails</p>
-              <p className="text-2xl font-bold text-gray-900">
-                {Object.values(analytics.category_distribution).reduce((a, b) => a + b, 0)}
-              </p>
-            </div>
-          </div>
-        </div>
-
-        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
-          <div className="flex items-center">
-            <div className="p-2 bg-green-100 rounded-lg">
-              <TrendingUp className="w-6 h-6 text-green-600" />
-            </div>
-            <div className="ml-4">
-              <p className="text-sm font-medium text-gray-600">Avg Confidence</p>
-              <p className="text-2xl font-bold text-gray-900">
-                {analytics.average_confidence ? 
-                  Math.round(
-                    Object.values(analytics.average_confidence).reduce((a, b) => a + b, 0) / 
-                    Object.keys(analytics.average_confidence).length * 100
-                  ) : 0}%
-              </p>
-            </div>
-          </div>
-        </div>
-
-        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
-          <div className="flex items-center">
-            <div className="p-2 bg-purple-100 rounded-lg">
-              <BarChart3 className="w-6 h-6 text-purple-600" />
-            </div>
-            <div className="ml-4">
-              <p className="text-sm font-medium text-gray-600">Categories</p>
-              <p className="text-2xl font-bold text-gray-900">
-                {Object.keys(analytics.category_distribution).length}
-              </p>
-            </div>
-          </div>
-        </div>
-      </div>
-
-      {/* Category Details */}
-      <div className="bg-white rounded-lg shadow-sm border border-gray-200 mt-8">
-        <div className="px-6 py-4 border-b border-gray-200">
-          <h3 className="text-lg font-semibold text-gray-900">Category Breakdown</h3>
-        </div>
-        <div className="divide-y divide-gray-200">
-          {Object.entries(analytics.category_distribution).map(([category, count]) => (
-            <div key={category} className="px-6 py-4">
-              <div className="flex items-center justify-between">
-                <div className="flex items-center space-x-3">
-                  <span className={`category-badge category-${category.toLowerCase()}`}>
-                    {category}
-                  </span>
-                  <span className="text-sm text-gray-600">{count} emails</span>
-                </div>
-                <div className="text-right">
-                  <div className="text-sm font-medium text-gray-900">
-                    {analytics.average_confidence[category] ? 
-                      Math.round(analytics.average_confidence[category] * 100) : 0}% confidence
-                  </div>
-                  <div className="text-xs text-gray-500">
-                    {Math.round((count / Object.values(analytics.category_distribution).reduce((a, b) => a + b, 0)) * 100)}% of total
-                  </div>
-                </div>
-              </div>
-            </div>
-          ))}
-        </div>
-      </div>
-    </div>
-  );
-};
-
+import React, { useState, useEffect } from 'react';
+import { 
+  BarChart3, 
+  TrendingUp, 
+  Download,
+  RefreshCw,
+  Brain,
+  Activity
+} from 'lucide-react';
+import { PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, LineChart, Line } from 'recharts';
+import { analyticsService } from '../services/analyticsService';
+
+interface AnalyticsData {
+  category_distribution: Record<string, number>;
+  average_confidence: Record<string, number>;
+  recent_activity: any[];
+}
+
+const COLORS = ['#0088FE', '#00C49F', '#FFBB28', '#FF8042', '#8884D8'];
+
+const Analytics: React.FC = () => {
+  const [analytics, setAnalytics] = useState<AnalyticsData | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [retraining, setRetraining] = useState(false);
+
+  useEffect(() => {
+    loadAnalytics();
+  }, []);
+
+  const loadAnalytics = async () => {
+    try {
+      setLoading(true);
+      const data = await analyticsService.getAnalytics();
+      setAnalytics(data);
+    } catch (error) {
+      console.error('Error loading analytics:', error);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const handleRetrainModel = async () => {
+    try {
+      setRetraining(true);
+      await analyticsService.retrainModel();
+      await loadAnalytics(); // Refresh data
+      // Show success message
+    } catch (error) {
+      console.error('Error retraining model:', error);
+    } finally {
+      setRetraining(false);
+    }
+  };
+
+  const handleExport = async () => {
+    try {
+      const blob = await analyticsService.exportAnalytics('csv');
+      const url = window.URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `analytics_${new Date().toISOString().split('T')[0]}.csv`;
+      a.click();
+      window.URL.revokeObjectURL(url);
+    } catch (error) {
+      console.error('Error exporting analytics:', error);
+    }
+  };
+
+  const prepareChartData = () => {
+    if (!analytics) return { pieData: [], barData: [], lineData: [] };
+
+    // Pie chart data for category distribution
+    const pieData = Object.entries(analytics.category_distribution).map(([name, value]) => ({
+      name,
+      value
+    }));
+
+    // Bar chart data for average confidence
+    const barData = Object.entries(analytics.average_confidence).map(([name, value]) => ({
+      name,
+      confidence: Math.round(value * 100)
+    }));
+
+    // Line chart data for recent activity (simulated)
+    const lineData = Array.from({ length: 7 }, (_, i) => ({
+      day: `Day ${i + 1}`,
+      emails: Math.floor(Math.random() * 50) + 10,
+      accuracy: Math.floor(Math.random() * 20) + 80
+    }));
+
+    return { pieData, barData, lineData };
+  };
+
+  if (loading) {
+    return (
+      <div className="p-8">
+        <div className="animate-pulse">
+          <div className="h-8 bg-gray-200 rounded w-1/4 mb-6"></div>
+          <div className="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-8">
+            {[...Array(4)].map((_, i) => (
+              <div key={i} className="h-64 bg-gray-200 rounded"></div>
+            ))}
+          </div>
+        </div>
+      </div>
+    );
+  }
+
+  if (!analytics) {
+    return (
+      <div className="p-8">
+        <div className="text-center text-gray-500">
+          <BarChart3 className="w-12 h-12 mx-auto mb-4 text-gray-300" />
+          <p>No analytics data available</p>
+        </div>
+      </div>
+    );
+  }
+
+  const { pieData, barData, lineData } = prepareChartData();
+
+  return (
+    <div className="p-8">
+      {/* Header */}
+      <div className="mb-8">
+        <h1 className="text-3xl font-bold text-gray-900 mb-2">Analytics</h1>
+        <p className="text-gray-600">Monitor system performance and email classification metrics</p>
+      </div>
+
+      {/* Quick Actions */}
+      <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-8">
+        <div className="flex flex-wrap gap-4">
+          <button
+            onClick={handleRetrainModel}
+            disabled={retraining}
+            className="flex items-center space-x-2 px-4 py-2 bg-purple-600 text-white rounded-lg hover:bg-purple-700 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {retraining ? (
+              <RefreshCw className="w-4 h-4 animate-spin" />
+            ) : (
+              <Brain className="w-4 h-4" />
+            )}
+            <span>{retraining ? 'Retraining...' : 'Retrain Model'}</span>
+          </button>
+
+          <button
+            onClick={handleExport}
+            className="flex items-center space-x-2 px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700"
+          >
+            <Download className="w-4 h-4" />
+            <span>Export Data</span>
+          </button>
+
+          <button
+            onClick={loadAnalytics}
+            className="flex items-center space-x-2 px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700"
+          >
+            <RefreshCw className="w-4 h-4" />
+            <span>Refresh</span>
+          </button>
+        </div>
+      </div>
+
+      {/* Charts Grid */}
+      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-8">
+        {/* Category Distribution Pie Chart */}
+        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
+          <h3 className="text-lg font-semibold text-gray-900 mb-4">Category Distribution</h3>
+          <ResponsiveContainer width="100%" height={300}>
+            <PieChart>
+              <Pie
+                data={pieData}
+                cx="50%"
+                cy="50%"
+                labelLine={false}
+                label={({ name, percent }) => `${name} ${(percent * 100).toFixed(0)}%`}
+                outerRadius={80}
+                fill="#8884d8"
+                dataKey="value"
+              >
+                {pieData.map((entry, index) => (
+                  <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
+                ))}
+              </Pie>
+              <Tooltip />
+            </PieChart>
+          </ResponsiveContainer>
+        </div>
+
+        {/* Average Confidence Bar Chart */}
+        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
+          <h3 className="text-lg font-semibold text-gray-900 mb-4">Average Confidence by Category</h3>
+          <ResponsiveContainer width="100%" height={300}>
+            <BarChart data={barData}>
+              <CartesianGrid strokeDasharray="3 3" />
+              <XAxis dataKey="name" />
+              <YAxis />
+              <Tooltip />
+              <Bar dataKey="confidence" fill="#8884d8" />
+            </BarChart>
+          </ResponsiveContainer>
+        </div>
+      </div>
+
+      {/* Performance Trends */}
+      <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-8">
+        <h3 className="text-lg font-semibold text-gray-900 mb-4">Performance Trends (Last 7 Days)</h3>
+        <ResponsiveContainer width="100%" height={300}>
+          <LineChart data={lineData}>
+            <CartesianGrid strokeDasharray="3 3" />
+            <XAxis dataKey="day" />
+            <YAxis yAxisId="left" />
+            <YAxis yAxisId="right" orientation="right" />
+            <Tooltip />
+            <Legend />
+            <Line yAxisId="left" type="monotone" dataKey="emails" stroke="#8884d8" name="Emails Processed" />
+            <Line yAxisId="right" type="monotone" dataKey="accuracy" stroke="#82ca9d" name="Accuracy %" />
+          </LineChart>
+        </ResponsiveContainer>
+      </div>
+
+      {/* Summary Stats */}
+      <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
+          <div className="flex items-center">
+            <div className="p-2 bg-blue-100 rounded-lg">
+              <Activity className="w-6 h-6 text-blue-600" />
+            </div>
+            <div className="ml-4">
+              <p className="text-sm font-medium text-gray-600">Total Emails</p>
+              <p className="text-2xl font-bold text-gray-900">
+                {Object.values(analytics.category_distribution).reduce((a, b) => a + b, 0)}
+              </p>
+            </div>
+          </div>
+        </div>
+
+        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
+          <div className="flex items-center">
+            <div className="p-2 bg-green-100 rounded-lg">
+              <TrendingUp className="w-6 h-6 text-green-600" />
+            </div>
+            <div className="ml-4">
+              <p className="text-sm font-medium text-gray-600">Avg Confidence</p>
+              <p className="text-2xl font-bold text-gray-900">
+                {analytics.average_confidence ? 
+                  Math.round(
+                    Object.values(analytics.average_confidence).reduce((a, b) => a + b, 0) / 
+                    Object.keys(analytics.average_confidence).length * 100
+                  ) : 0}%
+              </p>
+            </div>
+          </div>
+        </div>
+
+        <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
+          <div className="flex items-center">
+            <div className="p-2 bg-purple-100 rounded-lg">
+              <BarChart3 className="w-6 h-6 text-purple-600" />
+            </div>
+            <div className="ml-4">
+              <p className="text-sm font-medium text-gray-600">Categories</p>
+              <p className="text-2xl font-bold text-gray-900">
+                {Object.keys(analytics.category_distribution).length}
+              </p>
+            </div>
+          </div>
+        </div>
+      </div>
+
+      {/* Category Details */}
+      <div className="bg-white rounded-lg shadow-sm border border-gray-200 mt-8">
+        <div className="px-6 py-4 border-b border-gray-200">
+          <h3 className="text-lg font-semibold text-gray-900">Category Breakdown</h3>
+        </div>
+        <div className="divide-y divide-gray-200">
+          {Object.entries(analytics.category_distribution).map(([category, count]) => (
+            <div key={category} className="px-6 py-4">
+              <div className="flex items-center justify-between">
+                <div className="flex items-center space-x-3">
+                  <span className={`category-badge category-${category.toLowerCase()}`}>
+                    {category}
+                  </span>
+                  <span className="text-sm text-gray-600">{count} emails</span>
+                </div>
+                <div className="text-right">
+                  <div className="text-sm font-medium text-gray-900">
+                    {analytics.average_confidence[category] ? 
+                      Math.round(analytics.average_confidence[category] * 100) : 0}% confidence
+                  </div>
+                  <div className="text-xs text-gray-500">
+                    {Math.round((count / Object.values(analytics.category_distribution).reduce((a, b) => a + b, 0)) * 100)}% of total
+                  </div>
+                </div>
+              </div>
+            </div>
+          ))}
+        </div>
+      </div>
+    </div>
+  );
+};
+
 export default Analytics; 
\ No newline at end of file
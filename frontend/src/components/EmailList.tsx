@@ -1,317 +1,317 @@
-import React, { useState, useEffect } from 'react';
-import { 
-  Mail, 
-  Search, 
-  Filter, 
-  Download,
-  Edit3,
-  Eye,
-  CheckCircle,
-  XCircle
-} from 'lucide-react';
-import { emailService, Email } from '../services/emailService';
-
-const EmailList: React.FC = () => {
-  const [emails, setEmails] = useState<Email[]>([]);
-  const [loading, setLoading] = useState(true);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [totalEmails, setTotalEmails] = useState(0);
-  const [selectedCategory, setSelectedCategory] = useState<string>('');
-  const [searchQuery, setSearchQuery] = useState('');
-  const [editingEmail, setEditingEmail] = useState<number | null>(null);
-  const [editCategory, setEditCategory] = useState('');
-  const [editConfidence, setEditConfidence] = useState(1.0);
-
-  const categories = ['Support', 'Sales', 'Complaints', 'Feedback', 'General'];
-
-  useEffect(() => {
-    loadEmails();
-  }, [currentPage, selectedCategory, searchQuery]);
-
-  const loadEmails = async () => {
-    try {
-      setLoading(true);
-      let response;
-      
-      if (searchQuery) {
-        response = await emailService.searchEmails(searchQuery, currentPage);
-      } else if (selectedCategory) {
-        response = await emailService.getEmailsByCategory(selectedCategory, currentPage);
-      } else {
-        response = await emailService.getEmails(currentPage);
-      }
-      
-      setEmails(response.emails);
-      setTotalPages(response.pages);
-      setTotalEmails(response.total);
-    } catch (error) {
-      console.error('Error loading emails:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  const handleCategoryUpdate = async (emailId: number) => {
-    try {
-      await emailService.updateEmailCategory(emailId, editCategory, editConfidence);
-      setEditingEmail(null);
-      loadEmails(); // Refresh the list
-    } catch (error) {
-      console.error('Error updating email category:', error);
-    }
-  };
-
-  const handleExport = async () => {
-    try {
-      const blob = await emailService.exportEmails('csv');
-      const url = window.URL.createObjectURL(blob);
-      const a = document.createElement('a');
-      a.href = url;
-      a.download = `emails_${new Date().toISOString().split('T')[0]}.csv`;
-      a.click();
-      window.URL.revokeObjectURL(url);
-    } catch (error) {
-      console.error('Error exporting emails:', error);
-    }
-  };
-
-  const getCategoryBadgeClass = (category: string) => {
-    return `category-badge category-${category.toLowerCase()}`;
-  };
-
-  const formatDate = (dateString: string) => {
-    return new Date(dateString).toLocaleDateString('en-US', {
-      year: 'numeric',
-      month: 'short',
-      day: 'numeric',
-      hour: '2-digit',
-      minute: '2-digit'
-    });
-  };
-
-  if (loading && emails.length === 0) {
-    return (
-      <div className="p-8">
-        <div className="animate-pulse">
-          <div className="h-8 bg-gray-200 rounded w-1/4 mb-6"></div>
-          <div className="space-y-4">
-            {[...Array(5)].map((_, i) => (
-              <div key={i} className="h-24 bg-gray-200 rounded"></div>
-            ))}
-          </div>
-        </div>
-      </div>
-    );
-  }
-
-  return (
-    <div className="p-8">
-      {/* Header */}
-      <div className="mb-8">
-        <h1 className="text-3xl font-bold text-gray-900 mb-2">Email List</h1>
-        <p className="text-gray-600">View and manage all classified emails</p>
-      </div>
-
-      {/* Controls */}
-      <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-6">
-        <div className="flex flex-col lg:flex-row gap-4">
-          {/* Search */}
-          <div className="flex-1">
-            <div className="relative">
-              <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4" />
-              <input
-                type="text"
-                placeholder="Search emails..."
-                value={searchQuery}
-                onChange={(e) => setSearchQuery(e.target.value)}
-                className="w-full pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
-              />
-            </div>
-          </div>
-
-          {/* Category Filter */}
-          <div className="flex items-center space-x-2">
-            <Filter className="w-4 h-4 text-gray-400" />
-            <select
-              value={selectedCategory}
-              onChange={(e) => setSelectedCategory(e.target.value)}
-              className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
-            >
-              <option value="">All Categories</option>
-              {categories.map((category) => (
-                <option key={category} value={category}>{category}</option>
-              ))}
-            </select>
-          </div>
-
-          {/* Export Button */}
-          <button
-            onClick={handleExport}
-            className="flex items-center space-x-2 px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700"
-          >
-            <Download className="w-4 h-4" />
-            <span>Export</span>
-          </button>
-        </div>
-      </div>
-
-      {/* Email List */}
-      <div className="bg-white rounded-lg shadow-sm border border-gray-200">
-        <div className="px-6 py-4 border-b border-gray-200">
-          <div className="flex items-center justify-between">
-            <h2 className="text-lg font-semibold text-gray-900">
-              Emails ({totalEmails})
-            </h2>
-            <div className="text-sm text-gray-500">
-              Page {currentPage} of {totalPages}
-            </div>
-          </div>
-        </div>
-
-        <div className="divide-y divide-gray-200">
-          {emails.length === 0 ? (
-            <div className="px-6 py-8 text-center text-gray-500">
-              <Mail className="w-12 h-12 mx-auto mb-4 text-gray-300" />
-              <p>No emails found</p>
-              <p className="text-sm">Try adjusting your search or filters</p>
-            </div>
-          ) : (
-            emails.map((email) => (
-              <div key={email.id} className="px-6 py-4 hover:bg-gray-50">
-                <div className="flex items-start justify-between">
-                  <div className="flex-1 min-w-0">
-                    <div className="flex items-center space-x-3 mb-2">
-                      <h3 className="text-sm font-medium text-gray-900 truncate">
-                        {email.subject}
-                      </h3>
-                      <span className={getCategoryBadgeClass(email.category)}>
-                        {email.category}
-                      </span>
-                      <span className="text-sm text-gray-500">
-                        {Math.round(email.confidence * 100)}% confidence
-                      </span>
-                    </div>
-                    
-                    <p className="text-sm text-gray-600 mb-2 line-clamp-2">
-                      {email.body}
-                    </p>
-                    
-                    <div className="flex items-center space-x-4 text-xs text-gray-500">
-                      <span>From: {email.from_email || 'Unknown'}</span>
-                      <span>{formatDate(email.created_at)}</span>
-                      {email.auto_response && (
-                        <span className="text-green-600 flex items-center">
-                          <CheckCircle className="w-3 h-3 mr-1" />
-                          Auto-response sent
-                        </span>
-                      )}
-                    </div>
-                  </div>
-
-                  <div className="flex items-center space-x-2 ml-4">
-                    <button
-                      onClick={() => {
-                        setEditingEmail(email.id);
-                        setEditCategory(email.category);
-                        setEditConfidence(email.confidence);
-                      }}
-                      className="p-2 text-gray-400 hover:text-blue-600 hover:bg-blue-50 rounded-lg"
-                      title="Edit classification"
-                    >
-                      <Edit3 className="w-4 h-4" />
-                    </button>
-                  </div>
-                </div>
-
-                {/* Edit Form */}
-                {editingEmail === email.id && (
-                  <div className="mt-4 p-4 bg-blue-50 rounded-lg border border-blue-200">
-                    <div className="flex items-center space-x-4">
-                      <div>
-                        <label className="block text-sm font-medium text-gray-700 mb-1">
-                          Category
-                        </label>
-                        <select
-                          value={editCategory}
-                          onChange={(e) => setEditCategory(e.target.value)}
-                          className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
-                        >
-                          {categories.map((category) => (
-                            <option key={category} value={category}>{category}</option>
-                          ))}
-                        </select>
-                      </div>
-                      
-                      <div>
-                        <label className="block text-sm font-medium text-gray-700 mb-1">
-                          Confidence
-                        </label>
-                        <input
-                          type="number"
-                          min="0"
-                          max="1"
-                          step="0.1"
-                          value={editConfidence}
-                          onChange={(e) => setEditConfidence(parseFloat(e.target.value))}
-                          className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent w-20"
-                        />
-                      </div>
-
-                      <div className="flex items-end space-x-2">
-                        <button
-                          onClick={() => handleCategoryUpdate(email.id)}
-                          className="px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 text-sm"
-                        >
-                          Save
-                        </button>
-                        <button
-                          onClick={() => setEditingEmail(null)}
-                          className="px-3 py-2 bg-gray-600 text-white rounded-lg hover:bg-gray-700 text-sm"
-                        >
-                          Cancel
-                        </button>
-                      </div>
-                    </div>
-                  </div>
-                )}
-              </div>
-            ))
-          )}
-        </div>
-
-        {/* Pagination */}
-        {totalPages > 1 && (
-          <div className="px-6 py-4 border-t border-gray-200">
-            <div className="flex items-center justify-between">
-              <div className="text-sm text-gray-700">
-                Showing {((currentPage - 1) * 20) + 1} to {Math.min(currentPage * 20, totalEmails)} of {totalEmails} results
-              </div>
-              <div className="flex items-center space-x-2">
-                <button
-                  onClick={() => setCurrentPage(Math.max(1, currentPage - 1))}
-                  disabled={currentPage === 1}
-                  className="px-3 py-2 text-sm border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
-                >
-                  Previous
-                </button>
-                <span className="px-3 py-2 text-sm text-gray-700">
-                  {currentPage} of {totalPages}
-                </span>
-                <button
-                  onClick={() => setCurrentPage(Math.min(totalPages, currentPage + 1))}
-                  disabled={currentPage === totalPages}
-                  className="px-3 py-2 text-sm border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
-                >
-                  Next
-                </button>
-              </div>
-            </div>
-          </div>
-        )}
-      </div>
-    </div>
-  );
-};
-
+import React, { useState, useEffect } from 'react';
+import { 
+  Mail, 
+  Search, 
+  Filter, 
+  Download,
+  Edit3,
+  Eye,
+  CheckCircle,
+  XCircle
+} from 'lucide-react';
+import { emailService, Email } from '../services/emailService';
+
+const EmailList: React.FC = () => {
+  const [emails, setEmails] = useState<Email[]>([]);
+  const [loading, setLoading] = useState(true);
+  const [currentPage, setCurrentPage] = useState(1);
+  const [totalPages, setTotalPages] = useState(1);
+  const [totalEmails, setTotalEmails] = useState(0);
+  const [selectedCategory, setSelectedCategory] = useState<string>('');
+  const [searchQuery, setSearchQuery] = useState('');
+  const [editingEmail, setEditingEmail] = useState<number | null>(null);
+  const [editCategory, setEditCategory] = useState('');
+  const [editConfidence, setEditConfidence] = useState(1.0);
+
+  const categories = ['Support', 'Sales', 'Complaints', 'Feedback', 'General'];
+
+  useEffect(() => {
+    loadEmails();
+  }, [currentPage, selectedCategory, searchQuery]);
+
+  const loadEmails = async () => {
+    try {
+      setLoading(true);
+      let response;
+      
+      if (searchQuery) {
+        response = await emailService.searchEmails(searchQuery, currentPage);
+      } else if (selectedCategory) {
+        response = await emailService.getEmailsByCategory(selectedCategory, currentPage);
+      } else {
+        response = await emailService.getEmails(currentPage);
+      }
+      
+      setEmails(response.emails);
+      setTotalPages(response.pages);
+      setTotalEmails(response.total);
+    } catch (error) {
+      console.error('Error loading emails:', error);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const handleCategoryUpdate = async (emailId: number) => {
+    try {
+      await emailService.updateEmailCategory(emailId, editCategory, editConfidence);
+      setEditingEmail(null);
+      loadEmails(); // Refresh the list
+    } catch (error) {
+      console.error('Error updating email category:', error);
+    }
+  };
+
+  const handleExport = async () => {
+    try {
+      const blob = await emailService.exportEmails('csv');
+      const url = window.URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `emails_${new Date().toISOString().split('T')[0]}.csv`;
+      a.click();
+      window.URL.revokeObjectURL(url);
+    } catch (error) {
+      console.error('Error exporting emails:', error);
+    }
+  };
+
+  const getCategoryBadgeClass = (category: string) => {
+    return `category-badge category-${category.toLowerCase()}`;
+  };
+
+  const formatDate = (dateString: string) => {
+    return new Date(dateString).toLocaleDateString('en-US', {
+      year: 'numeric',
+      month: 'short',
+      day: 'numeric',
+      hour: '2-digit',
+      minute: '2-digit'
+    });
+  };
+
+  if (loading && emails.length === 0) {
+    return (
+      <div className="p-8">
+        <div className="animate-pulse">
+          <div className="h-8 bg-gray-200 rounded w-1/4 mb-6"></div>
+          <div className="space-y-4">
+            {[...Array(5)].map((_, i) => (
+              <div key={i} className="h-24 bg-gray-200 rounded"></div>
+            ))}
+          </div>
+        </div>
+      </div>
+    );
+  }
+
+  return (
+    <div className="p-8">
+      {/* Header */}
+      <div className="mb-8">
+        <h1 className="text-3xl font-bold text-gray-900 mb-2">Email List</h1>
+        <p className="text-gray-600">View and manage all classified emails</p>
+      </div>
+
+      {/* Controls */}
+      <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-6">
+        <div className="flex flex-col lg:flex-row gap-4">
+          {/* Search */}
+          <div className="flex-1">
+            <div className="relative">
+              <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4" />
+              <input
+                type="text"
+                placeholder="Search emails..."
+                value={searchQuery}
+                onChange={(e) => setSearchQuery(e.target.value)}
+                className="w-full pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+              />
+            </div>
+          </div>
+
+          {/* Category Filter */}
+          <div className="flex items-center space-x-2">
+            <Filter className="w-4 h-4 text-gray-400" />
+            <select
+              value={selectedCategory}
+              onChange={(e) => setSelectedCategory(e.target.value)}
+              className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+            >
+              <option value="">All Categories</option>
+              {categories.map((category) => (
+                <option key={category} value={category}>{category}</option>
+              ))}
+            </select>
+          </div>
+
+          {/* Export Button */}
+          <button
+            onClick={handleExport}
+            className="flex items-center space-x-2 px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700"
+          >
+            <Download className="w-4 h-4" />
+            <span>Export</span>
+          </button>
+        </div>
+      </div>
+
+      {/* Email List */}
+      <div className="bg-white rounded-lg shadow-sm border border-gray-200">
+        <div className="px-6 py-4 border-b border-gray-200">
+          <div className="flex items-center justify-between">
+            <h2 className="text-lg font-semibold text-gray-900">
+              Emails ({totalEmails})
+            </h2>
+            <div className="text-sm text-gray-500">
+              Page {currentPage} of {totalPages}
+            </div>
+          </div>
+        </div>
+
+        <div className="divide-y divide-gray-200">
+          {emails.length === 0 ? (
+            <div className="px-6 py-8 text-center text-gray-500">
+              <Mail className="w-12 h-12 mx-auto mb-4 text-gray-300" />
+              <p>No emails found</p>
+              <p className="text-sm">Try adjusting your search or filters</p>
+            </div>
+          ) : (
+            emails.map((email) => (
+              <div key={email.id} className="px-6 py-4 hover:bg-gray-50">
+                <div className="flex items-start justify-between">
+                  <div className="flex-1 min-w-0">
+                    <div className="flex items-center space-x-3 mb-2">
+                      <h3 className="text-sm font-medium text-gray-900 truncate">
+                        {email.subject}
+                      </h3>
+                      <span className={getCategoryBadgeClass(email.category)}>
+                        {email.category}
+                      </span>
+                      <span className="text-sm text-gray-500">
+                        {Math.round(email.confidence * 100)}% confidence
+                      </span>
+                    </div>
+                    
+                    <p className="text-sm text-gray-600 mb-2 line-clamp-2">
+                      {email.body}
+                    </p>
+                    
+                    <div className="flex items-center space-x-4 text-xs text-gray-500">
+                      <span>From: {email.from_email || 'Unknown'}</span>
+                      <span>{formatDate(email.created_at)}</span>
+                      {email.auto_response && (
+                        <span className="text-green-600 flex items-center">
+                          <CheckCircle className="w-3 h-3 mr-1" />
+                          Auto-response sent
+                        </span>
+                      )}
+                    </div>
+                  </div>
+
+                  <div className="flex items-center space-x-2 ml-4">
+                    <button
+                      onClick={() => {
+                        setEditingEmail(email.id);
+                        setEditCategory(email.category);
+                        setEditConfidence(email.confidence);
+                      }}
+                      className="p-2 text-gray-400 hover:text-blue-600 hover:bg-blue-50 rounded-lg"
+                      title="Edit classification"
+                    >
+                      <Edit3 className="w-4 h-4" />
+                    </button>
+                  </div>
+                </div>
+
+                {/* Edit Form */}
+                {editingEmail === email.id && (
+                  <div className="mt-4 p-4 bg-blue-50 rounded-lg border border-blue-200">
+                    <div className="flex items-center space-x-4">
+                      <div>
+                        <label className="block text-sm font-medium text-gray-700 mb-1">
+                          Category
+                        </label>
+                        <select
+                          value={editCategory}
+                          onChange={(e) => setEditCategory(e.target.value)}
+                          className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+                        >
+                          {categories.map((category) => (
+                            <option key={category} value={category}>{category}</option>
+                          ))}
+                        </select>
+                      </div>
+                      
+                      <div>
+                        <label className="block text-sm font-medium text-gray-700 mb-1">
+                          Confidence
+                        </label>
+                        <input
+                          type="number"
+                          min="0"
+                          max="1"
+                          step="0.1"
+                          value={editConfidence}
+                          onChange={(e) => setEditConfidence(parseFloat(e.target.value))}
+                          className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent w-20"
+                        />
+                      </div>
+
+                      <div className="flex items-end space-x-2">
+                        <button
+                          onClick={() => handleCategoryUpdate(email.id)}
+                          className="px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 text-sm"
+                        >
+                          Save
+                        </button>
+                        <button
+                          onClick={() => setEditingEmail(null)}
+                          className="px-3 py-2 bg-gray-600 text-white rounded-lg hover:bg-gray-700 text-sm"
+                        >
+                          Cancel
+                        </button>
+                      </div>
+                    </div>
+                  </div>
+                )}
+              </div>
+            ))
+          )}
+        </div>
+
+        {/* Pagination */}
+        {totalPages > 1 && (
+          <div className="px-6 py-4 border-t border-gray-200">
+            <div className="flex items-center justify-between">
+              <div className="text-sm text-gray-700">
+                Showing {((currentPage - 1) * 20) + 1} to {Math.min(currentPage * 20, totalEmails)} of {totalEmails} results
+              </div>
+              <div className="flex items-center space-x-2">
+                <button
+                  onClick={() => setCurrentPage(Math.max(1, currentPage - 1))}
+                  disabled={currentPage === 1}
+                  className="px-3 py-2 text-sm border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+                >
+                  Previous
+                </button>
+                <span className="px-3 py-2 text-sm text-gray-700">
+                  {currentPage} of {totalPages}
+                </span>
+                <button
+                  onClick={() => setCurrentPage(Math.min(totalPages, currentPage + 1))}
+                  disabled={currentPage === totalPages}
+                  className="px-3 py-2 text-sm border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+                >
+                  Next
+                </button>
+              </div>
+            </div>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+};
+
 export default EmailList; 
\ No newline at end of file
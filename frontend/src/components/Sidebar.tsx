@@ -1,73 +1,73 @@
-import React from 'react';
-import { Link, useLocation } from 'react-router-dom';
-import { 
-  Home, 
-  Mail, 
-  BarChart3, 
-  Settings, 
-  Brain,
-  MessageSquare
-} from 'lucide-react';
-
-const Sidebar: React.FC = () => {
-  const location = useLocation();
-
-  const navigation = [
-    { name: 'Dashboard', href: '/', icon: Home },
-    { name: 'Emails', href: '/emails', icon: Mail },
-    { name: 'Analytics', href: '/analytics', icon: BarChart3 },
-    { name: 'Settings', href: '/settings', icon: Settings },
-  ];
-
-  const isActive = (path: string) => location.pathname === path;
-
-  return (
-    <div className="w-64 bg-white shadow-lg border-r border-gray-200">
-      <div className="flex flex-col h-full">
-        {/* Header */}
-        <div className="flex items-center justify-center h-16 px-4 border-b border-gray-200">
-          <div className="flex items-center space-x-2">
-            <div className="w-8 h-8 bg-blue-600 rounded-lg flex items-center justify-center">
-              <Brain className="w-5 h-5 text-white" />
-            </div>
-            <div>
-              <h1 className="text-lg font-bold text-gray-900">Smart Email</h1>
-              <p className="text-xs text-gray-500">AI Classifier</p>
-            </div>
-          </div>
-        </div>
-
-        {/* Navigation */}
-        <nav className="flex-1 px-4 py-6 space-y-2">
-          {navigation.map((item) => {
-            const Icon = item.icon;
-            return (
-              <Link
-                key={item.name}
-                to={item.href}
-                className={`flex items-center space-x-3 px-3 py-2 rounded-lg text-sm font-medium transition-colors ${
-                  isActive(item.href)
-                    ? 'bg-blue-50 text-blue-700 border border-blue-200'
-                    : 'text-gray-700 hover:bg-gray-50 hover:text-gray-900'
-                }`}
-              >
-                <Icon className="w-5 h-5" />
-                <span>{item.name}</span>
-              </Link>
-            );
-          })}
-        </nav>
-
-        {/* Footer */}
-        <div className="p-4 border-t border-gray-200">
-          <div className="flex items-center space-x-2 text-sm text-gray-500">
-            <MessageSquare className="w-4 h-4" />
-            <span>Powered by AI</span>
-          </div>
-        </div>
-      </div>
-    </div>
-  );
-};
-
+import React from 'react';
+import { Link, useLocation } from 'react-router-dom';
+import { 
+  Home, 
+  Mail, 
+  BarChart3, 
+  Settings, 
+  Brain,
+  MessageSquare
+} from 'lucide-react';
+
+const Sidebar: React.FC = () => {
+  const location = useLocation();
+
+  const navigation = [
+    { name: 'Dashboard', href: '/', icon: Home },
+    { name: 'Emails', href: '/emails', icon: Mail },
+    { name: 'Analytics', href: '/analytics', icon: BarChart3 },
+    { name: 'Settings', href: '/settings', icon: Settings },
+  ];
+
+  const isActive = (path: string) => location.pathname === path;
+
+  return (
+    <div className="w-64 bg-white shadow-lg border-r border-gray-200">
+      <div className="flex flex-col h-full">
+        {/* Header */}
+        <div className="flex items-center justify-center h-16 px-4 border-b border-gray-200">
+          <div className="flex items-center space-x-2">
+            <div className="w-8 h-8 bg-blue-600 rounded-lg flex items-center justify-center">
+              <Brain className="w-5 h-5 text-white" />
+            </div>
+            <div>
+              <h1 className="text-lg font-bold text-gray-900">Smart Email</h1>
+              <p className="text-xs text-gray-500">AI Classifier</p>
+            </div>
+          </div>
+        </div>
+
+        {/* Navigation */}
+        <nav className="flex-1 px-4 py-6 space-y-2">
+          {navigation.map((item) => {
+            const Icon = item.icon;
+            return (
+              <Link
+                key={item.name}
+                to={item.href}
+                className={`flex items-center space-x-3 px-3 py-2 rounded-lg text-sm font-medium transition-colors ${
+                  isActive(item.href)
+                    ? 'bg-blue-50 text-blue-700 border border-blue-200'
+                    : 'text-gray-700 hover:bg-gray-50 hover:text-gray-900'
+                }`}
+              >
+                <Icon className="w-5 h-5" />
+                <span>{item.name}</span>
+              </Link>
+            );
+          })}
+        </nav>
+
+        {/* Footer */}
+        <div className="p-4 border-t border-gray-200">
+          <div className="flex items-center space-x-2 text-sm text-gray-500">
+            <MessageSquare className="w-4 h-4" />
+            <span>Powered by AI</span>
+          </div>
+        </div>
+      </div>
+    </div>
+  );
+};
+
 export default Sidebar; 
\ No newline at end of file